@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 import asyncio
-import json
+import orjson
 
 from backend.agent.services.chart_analysis import (
     ChartAnalysisRequest,
     ChartAnalysisService,
     StrategySuggestion,
 )
+from backend.agent.services.historical_prices import HistoricalPriceFetcher
 from backend.agent.services.support_resistance import (
     SupportResistanceRequest,
     SupportResistanceResponse,
@@ -36,9 +37,17 @@ app.add_middleware(
 )
 
 _analysis_service = ChartAnalysisService()
-_sr_service = SupportResistanceService()
+_history_fetcher = HistoricalPriceFetcher()
+_sr_service = SupportResistanceService(history=_history_fetcher)
 _jobs = MonitoringJobs()
 
+# App-scoped service so its result cache and the fetcher's connection pool persist across requests
+app.state.support_resistance_service = _sr_service
+
+
+def get_support_resistance_service(request: Request) -> SupportResistanceService:
+    return request.app.state.support_resistance_service
+
 
 @app.get("/health")
 async def healthcheck() -> dict[str, str]:
@@ -64,13 +73,17 @@ async def list_strategies() -> list[StrategySuggestion]:
 
 
 @app.post("/api/strategies/support-resistance", response_model=SupportResistanceResponse)
-async def build_support_resistance(request: SupportResistanceRequest) -> SupportResistanceResponse:
+async def build_support_resistance(
+    request: SupportResistanceRequest,
+    service: SupportResistanceService = Depends(get_support_resistance_service),
+) -> Response:
     try:
-        result = _sr_service.build(request)
+        result = await service.abuild(request)
+        payload = result.model_dump(mode="json")
         await event_bus.publish(
             {
                 "type": "strategy.support_resistance.created",
-                "payload": result.model_dump(mode="json"),
+                "payload": payload,
             }
         )
         # Kick off background monitoring for the returned bands
@@ -84,8 +97,9 @@ async def build_support_resistance(request: SupportResistanceRequest) -> Support
             for b in result.bands
         ]
         job_id = _jobs.start_band_watch(result.asset + "_USD", watched)
-        result.jobId = job_id
-        return result
+        # Serialize the already-dumped payload directly; the response_model is
+        # kept for the OpenAPI schema but not re-validated on the way out
+        return Response(content=orjson.dumps({**payload, "jobId": job_id}), media_type="application/json")
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except RuntimeError as exc:
@@ -101,8 +115,7 @@ async def stream_events(request: Request) -> StreamingResponse:
         async for event in event_bus.subscribe():
             if await request.is_disconnected():
                 break
-            data = json.dumps(event)
-            yield f"data: {data}\n\n".encode("utf-8")
+            yield b"data: " + orjson.dumps(event) + b"\n\n"
 
     headers = {
         "Cache-Control": "no-cache",
@@ -36,6 +36,13 @@ RSI_OVERBOUGHT = 70
 RSI_ENTRY_COOLDOWN = timedelta(minutes=5)
 
 
+# Support/resistance analysis defaults
+SUPPORT_RESISTANCE_CACHE_TTL = timedelta(minutes=5)
+SUPPORT_RESISTANCE_CACHE_SIZE = 64
+SUPPORT_RESISTANCE_BASE_PRICE_TTL = timedelta(seconds=60)
+SUPPORT_RESISTANCE_HISTORY_TIMEOUT = timedelta(seconds=20)
+
+
 # Risk management defaults
 MAX_PORTFOLIO_EXPOSURE = Decimal("0.25")  # 25% of capital per position
 STOP_LOSS_BPS = 150  # 1.50%
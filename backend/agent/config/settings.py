@@ -99,6 +99,16 @@ class StrategyConfig(BaseSettings):
     rsi_lookback_period: int = Field(default=constants.RSI_LOOKBACK_PERIOD)
     rsi_overbought: int = Field(default=constants.RSI_OVERBOUGHT)
     rsi_oversold: int = Field(default=constants.RSI_OVERSOLD)
+    support_resistance_cache_ttl_seconds: int = Field(
+        default=int(constants.SUPPORT_RESISTANCE_CACHE_TTL.total_seconds())
+    )
+    support_resistance_cache_size: int = Field(default=constants.SUPPORT_RESISTANCE_CACHE_SIZE)
+    support_resistance_base_price_ttl_seconds: int = Field(
+        default=int(constants.SUPPORT_RESISTANCE_BASE_PRICE_TTL.total_seconds())
+    )
+    support_resistance_history_timeout_seconds: float = Field(
+        default=constants.SUPPORT_RESISTANCE_HISTORY_TIMEOUT.total_seconds()
+    )
 
 
 ENV_FILE_PATH = Path(__file__).resolve().parent.parent / ".env"
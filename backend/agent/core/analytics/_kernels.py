@@ -0,0 +1,176 @@
+"""Numeric kernels for the analytics pipeline.
+
+Kernels operate on NumPy arrays only so they can be compiled with Numba
+(``cache=True`` keeps the compiled code on disk between runs). The public
+functions in the sibling modules convert to/from dataclasses around them.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from backend.agent.utils._njit import njit
+
+
+PEAK = 1
+TROUGH = -1
+
+
+@njit(cache=True)
+def wilder_rsi_nb(gains: np.ndarray, losses: np.ndarray, period: int) -> np.ndarray:
+    """RSI with Wilder's smoothing over per-bar gains/losses (``np.diff`` of closes).
+
+    The result is aligned with the closes, i.e. one longer than the inputs;
+    leading values are NaN.
+    """
+
+    n = gains.shape[0] + 1
+    rsi = np.full(n, np.nan)
+    if period <= 0 or n < period + 1:
+        return rsi
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(period):
+        avg_gain += gains[i]
+        avg_loss += losses[i]
+    avg_gain /= period
+    avg_loss /= period
+
+    if avg_loss == 0:
+        rsi[period] = 100.0
+    else:
+        rsi[period] = 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+
+    for i in range(period, n - 1):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        if avg_loss == 0:
+            rsi[i + 1] = 100.0
+        else:
+            rsi[i + 1] = 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+
+    return rsi
+
+
+@njit(cache=True)
+def detect_reversals_nb(
+    closes: np.ndarray,
+    min_separation_bars: int,
+    min_price_move_pct: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (indices, kinds, magnitudes) of local peaks/troughs in ``closes``.
+
+    ``kinds`` holds ``PEAK`` (1) or ``TROUGH`` (-1).
+    """
+
+    n = closes.shape[0]
+    indices = np.empty(n, dtype=np.int64)
+    kinds = np.empty(n, dtype=np.int8)
+    magnitudes = np.empty(n, dtype=np.float64)
+    count = 0
+
+    have_pivot = False
+    last_pivot_price = 0.0
+    last_index = -1
+
+    for i in range(1, n - 1):
+        prev_close = closes[i - 1]
+        close = closes[i]
+        next_close = closes[i + 1]
+
+        kind = 0
+        if (close > prev_close and close >= next_close) or (close >= prev_close and close > next_close):
+            kind = PEAK
+        elif (close < prev_close and close <= next_close) or (close <= prev_close and close < next_close):
+            kind = TROUGH
+        if kind == 0:
+            continue
+
+        if last_index >= 0 and (i - last_index) < min_separation_bars:
+            continue
+
+        magnitude_pct = 0.0
+        if have_pivot and last_pivot_price > 0:
+            magnitude_pct = abs(close - last_pivot_price) / last_pivot_price
+
+        if have_pivot and magnitude_pct < min_price_move_pct:
+            continue
+
+        indices[count] = i
+        kinds[count] = kind
+        magnitudes[count] = magnitude_pct
+        count += 1
+        have_pivot = True
+        last_pivot_price = close
+        last_index = i
+
+    return indices[:count], kinds[:count], magnitudes[:count]
+
+
+@njit(cache=True)
+def cluster_reversals_nb(prices: np.ndarray, tolerance_pct: float) -> np.ndarray:
+    """Assign cluster labels to ascending ``prices`` with a single sweep.
+
+    A price joins the current cluster when the cluster centre ``(lo + hi) / 2``
+    lies within ``tolerance_pct`` of the pair's midpoint; otherwise it opens a
+    new cluster. Because prices are sorted, any earlier cluster's centre is
+    further away than the current one's, so this matches first-fit grouping
+    against every cluster while staying O(n). Labels are numbered in order.
+    """
+
+    n = prices.shape[0]
+    labels = np.empty(n, dtype=np.int64)
+    label = -1
+    lo = 0.0
+    hi = 0.0
+
+    for i in range(n):
+        price = prices[i]
+        if label >= 0:
+            center = (lo + hi) / 2.0
+            mid = (price + center) / 2.0
+            if abs(price - center) <= mid * tolerance_pct:
+                hi = price
+                labels[i] = label
+                continue
+        label += 1
+        lo = price
+        hi = price
+        labels[i] = label
+
+    return labels
+
+
+@njit(cache=True)
+def count_real_and_unique_nb(closes: np.ndarray, synthetic: np.ndarray) -> tuple[int, int]:
+    """Return (non-synthetic count, distinct close count) in one pass after a sort.
+
+    Distinct values are counted with a sorted scan rather than a set so the
+    kernel compiles in nopython mode.
+    """
+
+    n = closes.shape[0]
+    real_count = 0
+    for i in range(n):
+        if not synthetic[i]:
+            real_count += 1
+    if n == 0:
+        return real_count, 0
+
+    ordered = np.sort(closes)
+    unique_count = 1
+    for i in range(1, n):
+        if ordered[i] != ordered[i - 1]:
+            unique_count += 1
+    return real_count, unique_count
+
+
+__all__ = [
+    "PEAK",
+    "TROUGH",
+    "cluster_reversals_nb",
+    "count_real_and_unique_nb",
+    "detect_reversals_nb",
+    "wilder_rsi_nb",
+]
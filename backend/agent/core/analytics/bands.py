@@ -8,9 +8,11 @@ classified as support (last trough) or resistance (last peak).
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import timedelta
 from typing import List, Literal, Optional, Tuple
 
+import numpy as np
+
+from ._kernels import cluster_reversals_nb
 from .reversals import ReversalPoint
 
 
@@ -30,26 +32,11 @@ class Band:
     projected_until_ts: Optional[int] = None
 
 
-def _in_tolerance(a: float, b: float, tolerance_pct: float) -> bool:
-    # Use symmetric tolerance around mid-price
-    mid = (a + b) / 2.0
-    width = mid * tolerance_pct
-    return abs(a - b) <= width
-
-
-def _merge_into_cluster(cluster: List[ReversalPoint], point: ReversalPoint, tolerance_pct: float) -> bool:
-    prices = [p.price for p in cluster]
-    lo, hi = min(prices), max(prices)
-    # If point fits within tolerance band expanded by tolerance width, merge it
-    if _in_tolerance(point.price, (lo + hi) / 2.0, tolerance_pct):
-        cluster.append(point)
-        return True
-    return False
-
-
 def cluster_reversals(reversals: List[ReversalPoint], tolerance_pct: float = 0.005) -> List[List[ReversalPoint]]:
     """Greedy single-pass clustering by price proximity.
 
+    Points are sorted by price and swept once, so grouping is O(n log n).
+
     tolerance_pct: fraction of price (e.g., 0.005 = 0.5%).
     """
 
@@ -58,16 +45,12 @@ def cluster_reversals(reversals: List[ReversalPoint], tolerance_pct: float = 0.0
 
     # Sort by price then time for stable grouping
     sorted_points = sorted(reversals, key=lambda r: (r.price, r.timestamp))
-    clusters: List[List[ReversalPoint]] = []
+    prices = np.fromiter((p.price for p in sorted_points), dtype=np.float64, count=len(sorted_points))
+    labels = cluster_reversals_nb(prices, tolerance_pct)
 
-    for pt in sorted_points:
-        placed = False
-        for cluster in clusters:
-            if _merge_into_cluster(cluster, pt, tolerance_pct):
-                placed = True
-                break
-        if not placed:
-            clusters.append([pt])
+    clusters: List[List[ReversalPoint]] = [[] for _ in range(int(labels.max()) + 1)]
+    for label, pt in zip(labels.tolist(), sorted_points):
+        clusters[label].append(pt)
 
     # Ensure points within each cluster are chronologically ordered
     for cluster in clusters:
@@ -162,7 +145,7 @@ def rank_bands(bands: List[Band], *, top_n_per_type: int = 3) -> List[Band]:
 def project_bands(bands: List[Band], *, projection_hours: int = 72) -> List[Band]:
     if projection_hours <= 0:
         return bands
-    delta = int(timedelta(hours=projection_hours).total_seconds())
+    delta = projection_hours * 3600
     for b in bands:
         b.projected_until_ts = b.last_touch_ts + delta
     return bands
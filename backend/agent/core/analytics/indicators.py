@@ -4,51 +4,32 @@ from __future__ import annotations
 
 from typing import Iterable, List
 
+import numpy as np
+
+from ._kernels import wilder_rsi_nb
 from .ohlc import Candle
 
 
-def _wilder_rsi_from_closes(closes: List[float], period: int = 14) -> List[float]:
-    """Compute RSI series using Wilder's smoothing.
+def rsi_from_closes(closes: np.ndarray, period: int = 14) -> np.ndarray:
+    """Compute an RSI series with Wilder's smoothing from a close-price array.
 
-    Returns a list of RSI values aligned with closes. The first (period)
-    entries will be `float('nan')` until enough data accumulates.
+    Returns an array aligned with ``closes``. The first ``period`` entries
+    are NaN until enough data accumulates.
     """
 
-    n = len(closes)
-    rsi: List[float] = [float("nan")] * n
-    if n == 0 or period <= 0 or n < period + 1:
-        return rsi
-
-    gains: List[float] = [0.0] * n
-    losses: List[float] = [0.0] * n
+    closes = np.asarray(closes, dtype=np.float64)
+    if closes.size < 2:
+        return np.full(closes.size, np.nan)
+    deltas = np.diff(closes)
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+    return wilder_rsi_nb(gains, losses, period)
 
-    for i in range(1, n):
-        delta = closes[i] - closes[i - 1]
-        gains[i] = max(delta, 0.0)
-        losses[i] = max(-delta, 0.0)
 
-    # Initial averages (simple average of first `period` gains/losses)
-    avg_gain = sum(gains[1 : period + 1]) / period
-    avg_loss = sum(losses[1 : period + 1]) / period
-
-    # First computable RSI value
-    if avg_loss == 0:
-        rsi[period] = 100.0
-    else:
-        rs = avg_gain / avg_loss
-        rsi[period] = 100.0 - (100.0 / (1.0 + rs))
-
-    # Wilder's smoothing for subsequent values
-    for i in range(period + 1, n):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-        if avg_loss == 0:
-            rsi[i] = 100.0
-        else:
-            rs = avg_gain / avg_loss
-            rsi[i] = 100.0 - (100.0 / (1.0 + rs))
+def _wilder_rsi_from_closes(closes: List[float], period: int = 14) -> List[float]:
+    """List-in/list-out wrapper around :func:`rsi_from_closes`."""
 
-    return rsi
+    return rsi_from_closes(np.asarray(closes, dtype=np.float64), period).tolist()
 
 
 def rsi_from_candles(candles: Iterable[Candle], period: int = 14) -> List[float]:
@@ -56,6 +37,6 @@ def rsi_from_candles(candles: Iterable[Candle], period: int = 14) -> List[float]
     return _wilder_rsi_from_closes(closes, period=period)
 
 
-__all__ = ["rsi_from_candles"]
+__all__ = ["rsi_from_candles", "rsi_from_closes"]
 
 
@@ -2,6 +2,7 @@
 
 This module provides:
 - A Candle dataclass representing a 4-hour OHLC bar
+- A CandleArray column (SoA) view for vectorised consumers
 - Aggregation from raw Pyth updates to 4-hour candles
 - Backfilling of missing candles using previous close
 """
@@ -9,14 +10,20 @@ This module provides:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from decimal import Decimal
-from typing import Dict, Iterable, List, Tuple
+from itertools import islice, repeat
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
 
 
 FOUR_HOURS_SECONDS = 4 * 60 * 60  # 14,400
 
+# Record layout used to pull (publish_time, price, expo) out of updates in one pass
+_UPDATE_DTYPE = np.dtype([("publish_time", np.int64), ("price", np.int64), ("expo", np.int64)])
+_UPDATE_CHUNK_SIZE = 4096
+
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
     start_time: int
     end_time: int
@@ -27,6 +34,47 @@ class Candle:
     count: int
     synthetic: bool = False
 
+    @classmethod
+    def from_arrays(
+        cls,
+        start_time: Any,
+        end_time: Any,
+        open: Any,
+        high: Any,
+        low: Any,
+        close: Any,
+        count: Any,
+        synthetic: Any,
+    ) -> "CandleArray":
+        """Build a column-oriented CandleArray without creating Candle instances."""
+        return CandleArray(
+            start_time=np.asarray(start_time, dtype=np.int64),
+            end_time=np.asarray(end_time, dtype=np.int64),
+            open=np.asarray(open, dtype=np.float64),
+            high=np.asarray(high, dtype=np.float64),
+            low=np.asarray(low, dtype=np.float64),
+            close=np.asarray(close, dtype=np.float64),
+            count=np.asarray(count, dtype=np.int64),
+            synthetic=np.asarray(synthetic, dtype=np.bool_),
+        )
+
+
+@dataclass(slots=True)
+class CandleArray:
+    """Candles stored as parallel NumPy columns, one entry per bar."""
+
+    start_time: np.ndarray
+    end_time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    count: np.ndarray
+    synthetic: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.close)
+
 
 def _window_bounds(epoch_seconds: int) -> Tuple[int, int]:
     start = (epoch_seconds // FOUR_HOURS_SECONDS) * FOUR_HOURS_SECONDS
@@ -34,12 +82,6 @@ def _window_bounds(epoch_seconds: int) -> Tuple[int, int]:
     return start, end
 
 
-def _to_float_price(price: int, expo: int) -> float:
-    # Pyth prices use expo (power of ten) scaling; handle negatives
-    scale = Decimal(10) ** Decimal(expo)
-    return float(Decimal(price) * scale)
-
-
 def aggregate_updates_to_4h_candles(
     updates: Iterable[Dict[str, int]],
     start_time: int,
@@ -54,37 +96,113 @@ def aggregate_updates_to_4h_candles(
     end_time: exclusive upper bound (unix seconds)
     """
 
-    # Bucket updates by 4h window start
-    buckets: Dict[int, List[Tuple[int, float]]] = {}
-    for item in updates:
-        ts = int(item["publish_time"])
-        if ts < start_time or ts >= end_time:
-            continue
-        price_float = _to_float_price(int(item["price"]), int(item["expo"]))
-        window_start, _ = _window_bounds(ts)
-        buckets.setdefault(window_start, []).append((ts, price_float))
-
-    # Build candles for every present bucket only (backfill handled separately)
-    candles: List[Candle] = []
-    for window_start, entries in sorted(buckets.items(), key=lambda kv: kv[0]):
-        window_end = window_start + FOUR_HOURS_SECONDS
-        # Sort entries chronologically
-        entries.sort(key=lambda t: t[0])
-        prices = [p for _, p in entries]
-        candles.append(
-            Candle(
-                start_time=window_start,
-                end_time=window_end,
-                open=prices[0],
-                high=max(prices),
-                low=min(prices),
-                close=prices[-1],
-                count=len(prices),
-                synthetic=False,
-            )
+    slots = _CandleSlots(start_time, end_time)
+    _add_update_dicts(slots, updates)
+    return slots.candles()
+
+
+def _add_update_dicts(slots: "_CandleSlots", updates: Iterable[Dict[str, int]]) -> bool:
+    """Fold update dicts into ``slots`` in fixed-size chunks; return whether any were seen.
+
+    Only one chunk of records is alive at a time, so a lazy iterable of
+    updates is never materialized in full.
+    """
+
+    iterator = iter(updates)
+    seen = False
+    while True:
+        chunk = list(islice(iterator, _UPDATE_CHUNK_SIZE))
+        if not chunk:
+            return seen
+        seen = True
+        records = np.fromiter(
+            ((int(u["publish_time"]), int(u["price"]), int(u["expo"])) for u in chunk),
+            dtype=_UPDATE_DTYPE,
+            count=len(chunk),
         )
+        slots.add_records(records)
 
-    return candles
+
+def _to_float_prices(price: np.ndarray, expo: np.ndarray) -> np.ndarray:
+    # Divide by the exact power of ten for negative exponents so results are
+    # correctly rounded, matching the Decimal-based scalar conversion
+    scale = np.power(10.0, np.abs(expo))
+    price_f = price.astype(np.float64)
+    return np.where(expo < 0, price_f / scale, price_f * scale)
+
+
+class _CandleSlots:
+    """Fixed-size OHLC accumulator with one slot per 4h window.
+
+    Memory is proportional to the number of windows, not the number of
+    updates, so batches can be streamed in and discarded. Ties on
+    publish_time resolve in arrival order (first for open, last for close).
+    """
+
+    def __init__(self, start_time: int, end_time: int) -> None:
+        self._start_time = start_time
+        self._end_time = end_time
+        self._base = (start_time // FOUR_HOURS_SECONDS) * FOUR_HOURS_SECONDS
+        size = max(0, -(-(end_time - self._base) // FOUR_HOURS_SECONDS))
+        self._open = np.zeros(size)
+        self._high = np.full(size, -np.inf)
+        self._low = np.full(size, np.inf)
+        self._close = np.zeros(size)
+        self._count = np.zeros(size, dtype=np.int64)
+        self._open_ts = np.full(size, np.iinfo(np.int64).max, dtype=np.int64)
+        self._close_ts = np.full(size, np.iinfo(np.int64).min, dtype=np.int64)
+
+    def add(self, publish_time: np.ndarray, price: np.ndarray) -> None:
+        in_range = (publish_time >= self._start_time) & (publish_time < self._end_time)
+        publish_time = publish_time[in_range]
+        price = price[in_range]
+        if publish_time.size == 0:
+            return
+
+        slot = (publish_time - self._base) // FOUR_HOURS_SECONDS
+        # Stable sort by slot then time keeps arrival order for equal timestamps
+        order = np.lexsort((publish_time, slot))
+        slot = slot[order]
+        publish_time = publish_time[order]
+        price = price[order]
+
+        slots, first_idx, counts = np.unique(slot, return_index=True, return_counts=True)
+        last_idx = first_idx + counts - 1
+
+        self._high[slots] = np.maximum(self._high[slots], np.maximum.reduceat(price, first_idx))
+        self._low[slots] = np.minimum(self._low[slots], np.minimum.reduceat(price, first_idx))
+        self._count[slots] += counts
+
+        first_ts = publish_time[first_idx]
+        earlier = first_ts < self._open_ts[slots]
+        self._open[slots[earlier]] = price[first_idx[earlier]]
+        self._open_ts[slots[earlier]] = first_ts[earlier]
+
+        last_ts = publish_time[last_idx]
+        later = last_ts >= self._close_ts[slots]
+        self._close[slots[later]] = price[last_idx[later]]
+        self._close_ts[slots[later]] = last_ts[later]
+
+    def add_records(self, records: np.ndarray) -> None:
+        self.add(records["publish_time"], _to_float_prices(records["price"], records["expo"]))
+
+    def candles(self) -> List[Candle]:
+        present = np.flatnonzero(self._count)
+        starts = self._base + present * FOUR_HOURS_SECONDS
+        # Columnar map avoids per-row tuple unpacking and keyword dispatch
+        return list(
+            map(
+                Candle,
+                starts.tolist(),
+                (starts + FOUR_HOURS_SECONDS).tolist(),
+                self._open[present].tolist(),
+                self._high[present].tolist(),
+                self._low[present].tolist(),
+                self._close[present].tolist(),
+                self._count[present].tolist(),
+                repeat(False, present.size),
+            )
+        )
 
 
 def backfill_missing_candles(
@@ -132,24 +250,19 @@ def backfill_missing_candles(
                     # No data at all
                     cursor = window_end
                     continue
-            full.append(
-                Candle(
-                    start_time=cursor,
-                    end_time=window_end,
-                    open=last_close,
-                    high=last_close,
-                    low=last_close,
-                    close=last_close,
-                    count=0,
-                    synthetic=True,
-                )
-            )
+            full.append(Candle(cursor, window_end, last_close, last_close, last_close, last_close, 0, True))
         cursor = window_end
 
     return full
 
 
-__all__ = ["Candle", "aggregate_updates_to_4h_candles", "backfill_missing_candles"]
+__all__ = [
+    "Candle",
+    "CandleArray",
+    "aggregate_updates_to_4h_candles",
+    "backfill_missing_candles",
+    "build_full_4h_candles_streaming",
+]
 
 
 def build_full_4h_candles(
@@ -159,14 +272,40 @@ def build_full_4h_candles(
 ) -> List[Candle]:
     """Aggregate and backfill to return a contiguous 4h candle series.
 
-    Convenience wrapper to produce a complete sequence in one call.
+    Convenience wrapper to produce a complete sequence in one call. ``updates``
+    is consumed lazily in chunks, so a generator keeps peak memory bounded by
+    the number of 4h windows. Callers holding update objects rather than
+    dicts should prefer
+    :func:`build_full_4h_candles_streaming`, which avoids the dict round trip.
     """
 
-    updates_list = list(updates)
-    if not updates_list:
+    slots = _CandleSlots(start_time, end_time)
+    if not _add_update_dicts(slots, updates):
         return []
-    aggregated = aggregate_updates_to_4h_candles(updates_list, start_time, end_time)
-    return backfill_missing_candles(aggregated, start_time, end_time)
+    return backfill_missing_candles(slots.candles(), start_time, end_time)
+
 
+def build_full_4h_candles_streaming(
+    batches: Iterable[Sequence[Any]],
+    start_time: int,
+    end_time: int,
+) -> List[Candle]:
+    """Streaming variant of :func:`build_full_4h_candles`.
 
+    Consumes batches of update objects exposing ``publish_time``, ``price``
+    and ``expo`` attributes (e.g. pages from the Hermes fetcher), folding
+    each into per-window aggregates before the next batch is requested.
+    """
 
+    slots = _CandleSlots(start_time, end_time)
+    for batch in batches:
+        n = len(batch)
+        if n == 0:
+            continue
+        records = np.fromiter(
+            ((u.publish_time, u.price, u.expo) for u in batch),
+            dtype=_UPDATE_DTYPE,
+            count=n,
+        )
+        slots.add_records(records)
+    return backfill_missing_candles(slots.candles(), start_time, end_time)
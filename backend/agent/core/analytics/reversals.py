@@ -7,8 +7,11 @@ This is a simple, robust approach suitable for feeding band clustering.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Literal, Optional
+from typing import List, Literal
 
+import numpy as np
+
+from ._kernels import PEAK, detect_reversals_nb
 from .ohlc import Candle
 
 
@@ -24,19 +27,6 @@ class ReversalPoint:
     magnitude_pct: float
 
 
-def _is_peak(prev_close: float, curr_close: float, next_close: float) -> bool:
-    # Prefer a strict change on one side to avoid flat plateaus triggering both
-    return (curr_close > prev_close and curr_close >= next_close) or (
-        curr_close >= prev_close and curr_close > next_close
-    )
-
-
-def _is_trough(prev_close: float, curr_close: float, next_close: float) -> bool:
-    return (curr_close < prev_close and curr_close <= next_close) or (
-        curr_close <= prev_close and curr_close < next_close
-    )
-
-
 def detect_reversals(
     candles: List[Candle],
     *,
@@ -55,45 +45,21 @@ def detect_reversals(
     if n < 3:
         return []
 
-    reversals: List[ReversalPoint] = []
-    last_pivot_price: Optional[float] = None
-    last_index: Optional[int] = None
-
-    for i in range(1, n - 1):
-        prev_c, c, next_c = candles[i - 1], candles[i], candles[i + 1]
-        prev_close, close, next_close = prev_c.close, c.close, next_c.close
-
-        kind: Optional[ReversalKind] = None
-        if _is_peak(prev_close, close, next_close):
-            kind = "peak"
-        elif _is_trough(prev_close, close, next_close):
-            kind = "trough"
-
-        if kind is None:
-            continue
-
-        if last_index is not None and (i - last_index) < min_separation_bars:
-            continue
-
-        magnitude_pct = 0.0
-        if last_pivot_price is not None and last_pivot_price > 0:
-            magnitude_pct = abs(close - last_pivot_price) / last_pivot_price
-
-        if magnitude_pct < min_price_move_pct and last_pivot_price is not None:
-            continue
+    closes = np.fromiter((c.close for c in candles), dtype=np.float64, count=n)
+    indices, kinds, magnitudes = detect_reversals_nb(closes, min_separation_bars, min_price_move_pct)
 
+    reversals: List[ReversalPoint] = []
+    for i, kind, magnitude_pct in zip(indices.tolist(), kinds.tolist(), magnitudes.tolist()):
+        c = candles[i]
         reversals.append(
             ReversalPoint(
                 index=i,
                 timestamp=c.start_time,
-                price=close,
-                kind=kind,
+                price=c.close,
+                kind="peak" if kind == PEAK else "trough",
                 magnitude_pct=magnitude_pct,
             )
         )
-        last_pivot_price = close
-        last_index = i
-
     return reversals
 
 
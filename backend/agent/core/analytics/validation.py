@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from functools import singledispatch
 from typing import Iterable
 
-from .ohlc import Candle
+import numpy as np
+
+from ._kernels import count_real_and_unique_nb
+from .ohlc import Candle, CandleArray
 
 
 def has_min_unique_datapoints(candles: Iterable[Candle], minimum_unique: int = 24) -> bool:
@@ -16,17 +20,32 @@ def is_complete_window(candles: Iterable[Candle], expected_count: int) -> bool:
     return sum(1 for _ in candles) >= expected_count
 
 
+@singledispatch
 def validate_candles(candles: Iterable[Candle], expected_count: int = 30, minimum_unique: int = 24) -> tuple[bool, list[str]]:
     """Return (ok, reasons) indicating dataset readiness for band detection."""
+    seq = candles if isinstance(candles, list) else list(candles)
+    n = len(seq)
+    closes = np.fromiter((c.close for c in seq), dtype=np.float64, count=n)
+    synthetic = np.fromiter((c.synthetic for c in seq), dtype=np.bool_, count=n)
+    return _validate_columns(closes, synthetic, expected_count, minimum_unique)
+
+
+@validate_candles.register
+def _(candles: CandleArray, expected_count: int = 30, minimum_unique: int = 24) -> tuple[bool, list[str]]:
+    return _validate_columns(candles.close, candles.synthetic, expected_count, minimum_unique)
+
+
+def _validate_columns(
+    closes: np.ndarray, synthetic: np.ndarray, expected_count: int, minimum_unique: int
+) -> tuple[bool, list[str]]:
     reasons: list[str] = []
-    seq = list(candles)
+    real_count, unique_count = count_real_and_unique_nb(closes, synthetic)
     # Accept synthetic backfill as valid for count, but require at least some real candles
-    real_count = sum(1 for c in seq if not c.synthetic)
-    if len(seq) < expected_count:
+    if len(closes) < expected_count:
         reasons.append("insufficient_candles")
     if real_count == 0:
         reasons.append("no_real_candles")
-    elif not has_min_unique_datapoints(seq, minimum_unique):
+    elif unique_count < minimum_unique:
         reasons.append("insufficient_unique_prices")
     return (len(reasons) == 0, reasons)
 
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import httpx
+import numpy as np
 
 from backend.agent.config.settings import AgentSettings, get_settings
 
@@ -29,27 +30,88 @@ class PriceFetcher:
         self.client = client or httpx.Client(timeout=5.0)
 
     def fetch_price(self, symbol: str) -> PriceData:
+        feed_id = self._feed_id(symbol)
+        data = self._get_latest([feed_id])
+
+        if not data:
+            raise ValueError(f"Empty response from Pyth for feed {feed_id}")
+
+        return self._parse_entry(data[0], feed_id)
+
+    def fetch_prices(self, symbols: Sequence[str]) -> Dict[str, PriceData]:
+        """Fetch latest prices for several symbols with a single Hermes request."""
+
+        feed_ids = {symbol: self._feed_id(symbol) for symbol in symbols}
+        if not feed_ids:
+            return {}
+
+        data = self._get_latest(list(dict.fromkeys(feed_ids.values())))
+        entries = {_strip_prefix(str(entry.get("id", ""))).lower(): entry for entry in data or []}
+
+        prices: Dict[str, PriceData] = {}
+        for symbol, feed_id in feed_ids.items():
+            entry = entries.get(_strip_prefix(feed_id).lower())
+            if entry is None:
+                raise ValueError(f"No price returned from Pyth for feed {feed_id}")
+            prices[symbol] = self._parse_entry(entry, feed_id)
+        return prices
+
+    def fetch_recent_prices(self, symbol: str, n: int) -> List[float]:
+        """Fetch the last ``n`` prices for ``symbol`` oldest-first in one Hermes request."""
+
+        feed_id = self._feed_id(symbol)
+        if n <= 0:
+            return []
+
+        base_url = str(self.settings.pyth.endpoint).rstrip("/")
+        url = f"{base_url}/v2/updates/price/{_strip_prefix(feed_id)}"
+        params = {"parsed": True, "encoding": "json", "limit": n}
+        response = self.client.get(url, params=params, headers=self._headers())
+        response.raise_for_status()
+        payload: Any = response.json()
+        items = payload.get("data", []) if isinstance(payload, dict) else payload
+        if not items:
+            raise ValueError(f"Empty update history from Pyth for feed {feed_id}")
+
+        records: List[Tuple[int, int, int]] = []
+        for item in items:
+            parsed = item.get("parsed") or item
+            price_info = parsed.get("price") or {}
+            if "price" not in price_info:
+                continue
+            publish_time = int(price_info.get("publish_time", parsed.get("publish_time", 0)))
+            records.append((publish_time, int(price_info["price"]), int(price_info.get("expo", 0))))
+        if not records:
+            return []
+        publish_times, raw, expo = np.array(records, dtype=np.int64).T
+        # Divide for negative exponents so each price is the correctly rounded raw / 10**-expo
+        scale = np.power(10.0, np.abs(expo))
+        prices = np.where(expo < 0, raw / scale, raw * scale)
+        order = np.argsort(publish_times, kind="stable")
+        return prices[order][-n:].tolist()
+
+    def _feed_id(self, symbol: str) -> str:
         feed_id = self.settings.pyth.price_feed_ids.get(symbol)
         if not feed_id:
             raise ValueError(f"No Pyth feed configured for symbol: {symbol}")
+        return feed_id
 
-        feed_param = feed_id[2:] if feed_id.startswith("0x") else feed_id
-
+    def _get_latest(self, feed_ids: Sequence[str]) -> Any:
         base_url = str(self.settings.pyth.endpoint).rstrip("/")
         url = f"{base_url}/api/latest_price_feeds"
-        params = {"ids[]": feed_param}
+        # Hermes accepts repeated ids[] parameters, one per feed
+        params = [("ids[]", _strip_prefix(feed_id)) for feed_id in feed_ids]
+        response = self.client.get(url, params=params, headers=self._headers())
+        response.raise_for_status()
+        return response.json()
+
+    def _headers(self) -> Dict[str, str]:
         headers: Dict[str, str] = {}
         if self.settings.pyth.api_key:
             headers["Authorization"] = f"Bearer {self.settings.pyth.api_key.get_secret_value()}"
+        return headers
 
-        response = self.client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        data: Any = response.json()
-
-        if not data:
-            raise ValueError(f"Empty response from Pyth for feed {feed_id}")
-
-        entry: Dict[str, Any] = data[0]
+    def _parse_entry(self, entry: Dict[str, Any], feed_id: str) -> PriceData:
         price_info = entry.get("price")
         if not price_info:
             raise ValueError(f"No price data in response for feed {feed_id}: {entry}")
@@ -70,3 +132,5 @@ class PriceFetcher:
         )
 
 
+def _strip_prefix(feed_id: str) -> str:
+    return feed_id[2:] if feed_id.startswith("0x") else feed_id
@@ -5,6 +5,8 @@ from __future__ import annotations
 from collections import deque
 from typing import Deque, Iterable, List
 
+import numpy as np
+
 
 class RSICalculator:
     """Calculates Relative Strength Index using Wilder's smoothing."""
@@ -52,4 +54,20 @@ class RSICalculator:
             calculator.add_price(price)
         return calculator.compute()
 
+    @staticmethod
+    def from_ndarray(prices: np.ndarray, period: int) -> float:
+        """Vectorised ``from_series`` for a float array of prices, oldest first."""
+        if period <= 0:
+            raise ValueError("RSI period must be positive")
+        if len(prices) < period + 1:
+            raise ValueError("Not enough data to compute RSI")
+
+        deltas = np.diff(np.asarray(prices, dtype=np.float64)[-(period + 1) :])
+        avg_gain = float(np.clip(deltas, 0.0, None).sum()) / period
+        avg_loss = float(np.clip(-deltas, 0.0, None).sum()) / period
 
+        if avg_loss == 0:
+            return 100.0
+
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
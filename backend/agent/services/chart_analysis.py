@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import base64
+import os
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 import json
 from typing import Any, Dict, List
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from backend.agent.config.settings import AgentSettings, get_settings
 from backend.agent.services.openrouter_client import OpenRouterClient, OpenRouterError
@@ -45,6 +46,10 @@ class StrategySuggestion(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+# Built once at import so the core schema is compiled a single time and shared
+STRATEGY_LIST_ADAPTER: TypeAdapter[List[StrategySuggestion]] = TypeAdapter(List[StrategySuggestion])
+
+
 class StrategyStore:
     """Simple JSON-backed store for recently generated strategies."""
 
@@ -56,9 +61,18 @@ class StrategyStore:
     def list(self) -> List[StrategySuggestion]:
         if not self._storage_path.exists():
             return []
-        raw = self._storage_path.read_text(encoding="utf-8")
+        raw = self._storage_path.read_bytes()
         if not raw.strip():
             return []
+        # Fast path: pydantic-core parses and validates the whole file at once
+        try:
+            return STRATEGY_LIST_ADAPTER.validate_json(raw)
+        except ValidationError:
+            return self._list_lenient(raw)
+
+    def _list_lenient(self, raw: bytes) -> List[StrategySuggestion]:
+        """Salvage valid entries from a file containing malformed items."""
+
         try:
             payload = json.loads(raw)
         except json.JSONDecodeError:
@@ -81,8 +95,17 @@ class StrategyStore:
         # Sort newest first and trim
         existing.sort(key=lambda s: s.created_at, reverse=True)
         trimmed = existing[: self._max_entries]
-        payload = [item.model_dump(mode="json") for item in trimmed]
-        self._storage_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._write_atomic(STRATEGY_LIST_ADAPTER.dump_json(trimmed, indent=2))
+
+    def _write_atomic(self, data: bytes) -> None:
+        """Write via a temp file and rename so a crash never leaves a truncated store."""
+
+        tmp_path = self._storage_path.with_suffix(self._storage_path.suffix + ".tmp")
+        with open(tmp_path, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, self._storage_path)
 
 
 class ChartAnalysisService:
@@ -243,6 +266,7 @@ class ChartAnalysisService:
 
 
 __all__ = [
+    "STRATEGY_LIST_ADAPTER",
     "ChartAnalysisRequest",
     "ChartAnalysisService",
     "StrategyAction",
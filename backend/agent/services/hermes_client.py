@@ -8,6 +8,7 @@ handling.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 import base64
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -20,6 +21,7 @@ class HermesClientError(RuntimeError):
     """Raised when Hermes returns an error or an unexpected payload."""
 
 
+@cache
 def _parse_hermes_endpoint(raw_endpoint: str) -> Tuple[str, Dict[str, str]]:
     """Parse endpoint, extracting basic auth if embedded in the URL.
 
@@ -66,7 +68,8 @@ class HermesClient:
         base_url, headers = _parse_hermes_endpoint(endpoint)
 
         self._base_url = base_url.rstrip("/")
-        self._headers: Dict[str, str] = headers
+        # Copy: the parsed headers are memoized and shared between instances
+        self._headers: Dict[str, str] = dict(headers)
         if self._settings.pyth.api_key:
             self._headers["Authorization"] = f"Bearer {self._settings.pyth.api_key.get_secret_value()}"
 
@@ -74,6 +77,7 @@ class HermesClient:
         self._client = client or httpx.Client(timeout=10.0)
 
     @staticmethod
+    @cache
     def _normalize_feed_id(feed_id: str) -> str:
         return feed_id[2:] if feed_id.lower().startswith("0x") else feed_id
 
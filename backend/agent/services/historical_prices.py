@@ -7,23 +7,29 @@ backfilling are handled in separate steps.
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache
 import base64
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import httpx
+import numpy as np
 
 from backend.agent.config.settings import AgentSettings, get_settings
 
 
+@cache
 def _ensure_prefixed_feed_id(feed_id: str) -> str:
     return feed_id if feed_id.lower().startswith("0x") else f"0x{feed_id}"
 
 
+@cache
 def _strip_prefix(feed_id: str) -> str:
     return feed_id[2:] if feed_id.lower().startswith("0x") else feed_id
 
 
+@cache
 def _parse_hermes_endpoint(raw_endpoint: str) -> Tuple[str, Dict[str, str]]:
     headers: Dict[str, str] = {}
     try:
@@ -46,10 +52,70 @@ class PriceUpdate:
     expo: int
 
 
+class IncompleteHistoryError(RuntimeError):
+    """Raised by ``iter_updates`` when Hermes fails after some pages were already yielded."""
+
+
+_ItemParser = Callable[[Dict[str, Any]], PriceUpdate]
+
+
+def _item_parser_for(sample: Dict[str, Any]) -> _ItemParser:
+    """Bind a parser specialized to the key layout of ``sample``.
+
+    The returned parser indexes keys directly; items with a different
+    layout raise and are handled by the lenient parser instead.
+    """
+
+    nested = bool(sample.get("parsed"))
+    body = sample["parsed"] if nested else sample
+    time_key = "publish_time" if "publish_time" in body else "publishTime"
+    price_key = "price" if body.get("price") else "ema_price"
+
+    if nested:
+
+        def parse_nested(item: Dict[str, Any]) -> PriceUpdate:
+            parsed = item["parsed"]
+            price_obj = parsed[price_key]
+            return PriceUpdate(int(parsed[time_key]), int(price_obj["price"]), int(price_obj["expo"]))
+
+        return parse_nested
+
+    def parse_flat(item: Dict[str, Any]) -> PriceUpdate:
+        price_obj = item[price_key]
+        return PriceUpdate(int(item[time_key]), int(price_obj["price"]), int(price_obj["expo"]))
+
+    return parse_flat
+
+
+def _parse_update_items_lenient(items: List[Dict[str, Any]]) -> List[PriceUpdate]:
+    """Per-item tolerant parser; skips entries that cannot be converted."""
+
+    updates: List[PriceUpdate] = []
+    for item in items:
+        try:
+            parsed = item.get("parsed") or item
+            price_obj = parsed.get("price") or parsed.get("ema_price") or {}
+            updates.append(
+                PriceUpdate(
+                    publish_time=int(parsed.get("publish_time") or parsed.get("publishTime") or 0),
+                    price=int(price_obj.get("price", 0)),
+                    expo=int(price_obj.get("expo", 0)),
+                )
+            )
+        except Exception:
+            continue
+    return updates
+
+
 class HistoricalPriceFetcher:
     """Fetch raw historical price updates from Hermes with basic pagination.
 
     Caching: in-memory dictionary keyed by (feed_id, start_time, end_time).
+    Pagination: the next page is requested on a background worker owned by
+    that pagination call while the current page is being parsed, so
+    concurrent callers never queue behind each other.
+    Streaming: ``iter_updates`` yields one parsed page at a time so callers
+    can aggregate without holding the full window in memory.
     """
 
     def __init__(self, settings: Optional[AgentSettings] = None, client: Optional[httpx.Client] = None) -> None:
@@ -57,13 +123,18 @@ class HistoricalPriceFetcher:
         endpoint = str(self._settings.pyth.endpoint)
         base_url, headers = _parse_hermes_endpoint(endpoint)
         self._base_url = base_url.rstrip("/")
-        self._headers: Dict[str, str] = headers
+        # Copy: the parsed headers are memoized and shared between instances
+        self._headers: Dict[str, str] = dict(headers)
         if self._settings.pyth.api_key:
             self._headers["Authorization"] = f"Bearer {self._settings.pyth.api_key.get_secret_value()}"
         self._client = client or httpx.Client(timeout=15.0)
         self._cache: Dict[Tuple[str, int, int], List[PriceUpdate]] = {}
+        # Item parser specialized on the first page seen for each base URL
+        self._shape_cache: Dict[str, _ItemParser] = {}
 
     def fetch_updates(self, feed_id: str, start_time: int, end_time: int, page_size: int = 5000) -> List[PriceUpdate]:
+        """Materialize, sort and cache every update in the window."""
+
         key = (feed_id.lower(), int(start_time), int(end_time))
         if key in self._cache:
             return self._cache[key]
@@ -71,16 +142,65 @@ class HistoricalPriceFetcher:
         prefixed_id = _ensure_prefixed_feed_id(feed_id)
         stripped_id = _strip_prefix(feed_id)
 
-        updates = self._try_updates_api(prefixed_id, start_time, end_time, page_size)
-        if not updates:
-            updates = self._try_updates_api(stripped_id, start_time, end_time, page_size)
+        updates: List[PriceUpdate] = []
+        for feed_identifier in (prefixed_id, stripped_id):
+            try:
+                updates = [
+                    u for batch in self._iter_updates_api(feed_identifier, start_time, end_time, page_size) for u in batch
+                ]
+            except IncompleteHistoryError:
+                # A partial window is no better than none; try the next source
+                updates = []
+            if updates:
+                break
         if not updates:
             updates = self._fallback_history_api(prefixed_id, stripped_id, start_time, end_time)
-        updates.sort(key=lambda u: u.publish_time)
+        updates = _sort_by_publish_time(updates)
         self._cache[key] = updates
         return updates
 
-    def _try_updates_api(self, feed_identifier: str, start_time: int, end_time: int, page_size: int) -> List[PriceUpdate]:
+    def iter_updates(
+        self, feed_id: str, start_time: int, end_time: int, page_size: int = 5000
+    ) -> Iterator[List[PriceUpdate]]:
+        """Yield updates one page at a time without holding the full window.
+
+        Batches are in arrival order, not globally sorted. Falls back to the
+        stripped feed ID and then the history endpoint only when nothing was
+        yielded by the previous source. If a source fails after yielding some
+        pages, raises :class:`IncompleteHistoryError` rather than ending the
+        stream early, since the pages already yielded cannot be withdrawn;
+        callers needing a complete window can retry with :meth:`fetch_updates`.
+        """
+
+        cached = self._cache.get((feed_id.lower(), int(start_time), int(end_time)))
+        if cached is not None:
+            if cached:
+                yield cached
+            return
+
+        prefixed_id = _ensure_prefixed_feed_id(feed_id)
+        stripped_id = _strip_prefix(feed_id)
+
+        for feed_identifier in (prefixed_id, stripped_id):
+            yielded = False
+            try:
+                for batch in self._iter_updates_api(feed_identifier, start_time, end_time, page_size):
+                    yielded = True
+                    yield batch
+            except IncompleteHistoryError:
+                if yielded:
+                    raise
+                continue
+            if yielded:
+                return
+
+        fallback = self._fallback_history_api(prefixed_id, stripped_id, start_time, end_time)
+        if fallback:
+            yield fallback
+
+    def _iter_updates_api(
+        self, feed_identifier: str, start_time: int, end_time: int, page_size: int
+    ) -> Iterator[List[PriceUpdate]]:
         url = f"{self._base_url}/v2/updates/price/{feed_identifier}"
         params: Dict[str, Any] = {
             "start_time": start_time,
@@ -89,17 +209,26 @@ class HistoricalPriceFetcher:
             "parsed": True,
             "encoding": "json",
         }
-        updates: List[PriceUpdate] = []
         next_token: Optional[str] = None
+        pending: Optional[Future[httpx.Response]] = None
+        # Created on the first next_token, so single-page windows never start a thread
+        prefetch: Optional[ThreadPoolExecutor] = None
         try:
             while True:
-                if next_token:
-                    params["page_token"] = next_token
-                response = self._client.get(url, params=params, headers=self._headers)
-                if response.status_code >= 400:
-                    # Give caller a chance to fallback
-                    return []
-                payload: Any = response.json()
+                try:
+                    response = (
+                        self._client.get(url, params=params, headers=self._headers)
+                        if pending is None
+                        else pending.result()
+                    )
+                    # Give caller a chance to fallback (or to discard pages already yielded)
+                    if response.status_code >= 400:
+                        raise IncompleteHistoryError(f"Hermes returned {response.status_code} for {feed_identifier}")
+                    payload: Any = response.json()
+                except IncompleteHistoryError:
+                    raise
+                except Exception as exc:
+                    raise IncompleteHistoryError(f"Hermes updates request failed for {feed_identifier}") from exc
                 items: List[Dict[str, Any]]
                 if isinstance(payload, dict) and isinstance(payload.get("data"), list):
                     items = payload["data"]
@@ -108,25 +237,35 @@ class HistoricalPriceFetcher:
                     items = payload
                     next_token = None
                 else:
-                    break
-                for item in items:
-                    parsed = item.get("parsed") or item
-                    price_obj = parsed.get("price") or parsed.get("ema_price") or {}
-                    try:
-                        updates.append(
-                            PriceUpdate(
-                                publish_time=int(parsed.get("publish_time") or parsed.get("publishTime") or 0),
-                                price=int(price_obj.get("price", 0)),
-                                expo=int(price_obj.get("expo", 0)),
-                            )
-                        )
-                    except Exception:
-                        continue
-                if not next_token:
-                    break
-        except Exception:
-            return []
-        return updates
+                    return
+                # Keep the connection busy while this page is being parsed/consumed
+                pending = None
+                if next_token:
+                    params["page_token"] = next_token
+                    if prefetch is None:
+                        prefetch = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hermes-prefetch")
+                    pending = prefetch.submit(self._client.get, url, params=dict(params), headers=self._headers)
+                batch = self._parse_page(items) if items else []
+                if batch:
+                    yield batch
+                if pending is None:
+                    return
+        finally:
+            # Also runs when the consumer stops early; don't block on an abandoned page
+            if prefetch is not None:
+                prefetch.shutdown(wait=False, cancel_futures=True)
+
+    def _parse_page(self, items: List[Dict[str, Any]]) -> List[PriceUpdate]:
+        parser = self._shape_cache.get(self._base_url)
+        try:
+            if parser is None:
+                parser = _item_parser_for(items[0])
+                self._shape_cache[self._base_url] = parser
+            return list(map(parser, items))
+        except (KeyError, TypeError, ValueError, AttributeError):
+            # Payload shape changed; re-probe on the next page
+            self._shape_cache.pop(self._base_url, None)
+            return _parse_update_items_lenient(items)
 
     def _fallback_history_api(
         self, prefixed_id: str, stripped_id: str, start_time: int, end_time: int
@@ -148,6 +287,9 @@ class HistoricalPriceFetcher:
                 data: Any = resp.json()
                 history = data.get("price_history") or data.get("data") or []
                 items: List[Any] = history if isinstance(history, list) else []
+                publish_times: List[int] = []
+                prices: List[int] = []
+                expos: List[int] = []
                 for entry in items:
                     try:
                         # Support flat or nested price/expo shapes
@@ -165,15 +307,17 @@ class HistoricalPriceFetcher:
                         )
                         if publish_time is None:
                             continue
-                        pu = PriceUpdate(
-                            publish_time=int(publish_time),
-                            price=int(price_val),
-                            expo=int(expo_val or 0),
-                        )
-                        if start_time <= pu.publish_time < end_time:
-                            all_updates.append(pu)
+                        parsed = (int(publish_time), int(price_val), int(expo_val or 0))
                     except Exception:
                         continue
+                    publish_times.append(parsed[0])
+                    prices.append(parsed[1])
+                    expos.append(parsed[2])
+                if publish_times:
+                    # One vectorized range check instead of a branch per entry
+                    times = np.asarray(publish_times, dtype=np.int64)
+                    keep = np.flatnonzero((times >= start_time) & (times < end_time))
+                    all_updates = [PriceUpdate(publish_times[i], prices[i], expos[i]) for i in keep.tolist()]
                 if all_updates:
                     break
             except Exception:
@@ -181,6 +325,19 @@ class HistoricalPriceFetcher:
         return all_updates
 
 
-__all__ = ["HistoricalPriceFetcher", "PriceUpdate"]
+def _sort_by_publish_time(updates: List[PriceUpdate]) -> List[PriceUpdate]:
+    """Stable sort by publish_time, skipping the reorder when already sorted."""
+
+    if len(updates) < 2:
+        return updates
+    times = np.fromiter((u.publish_time for u in updates), dtype=np.int64, count=len(updates))
+    if bool(np.all(times[1:] >= times[:-1])):
+        # Hermes pages normally arrive in chronological order
+        return updates
+    order = np.argsort(times, kind="stable")
+    return [updates[i] for i in order.tolist()]
+
+
+__all__ = ["HistoricalPriceFetcher", "IncompleteHistoryError", "PriceUpdate"]
 
 
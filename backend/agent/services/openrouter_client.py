@@ -2,22 +2,32 @@
 
 from __future__ import annotations
 
-import json
+import re
 from typing import Any, Dict
 
 import httpx
+import orjson
 
 from backend.agent.config.settings import AgentSettings, get_settings
 
 
+# Models occasionally wrap JSON output in a markdown code fence
+_CODE_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*\n?(.*?)\n?\s*```\s*$", re.DOTALL | re.IGNORECASE)
+
+
 class OpenRouterError(RuntimeError):
     """Raised when the OpenRouter API returns an error."""
 
 class OpenRouterClient:
     """Async client for OpenRouter LLM interactions."""
 
-    def __init__(self, settings: AgentSettings | None = None) -> None:
+    def __init__(
+        self,
+        settings: AgentSettings | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         self._settings = settings or get_settings()
+        self._transport = transport
         self._base_url = str(self._settings.llm.base_url)
         self._timeout = httpx.Timeout(self._settings.llm.request_timeout_seconds)
         if self._settings.llm.api_key is None:
@@ -37,15 +47,15 @@ class OpenRouterClient:
 
         url = f"{self._base_url.rstrip('/')}/chat/completions"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
+        async with httpx.AsyncClient(timeout=self._timeout, transport=self._transport) as client:
             response = await client.post(url, json=payload, headers=headers)
 
         if response.status_code >= 400:
             raise OpenRouterError(f"OpenRouter API error {response.status_code}: {response.text}")
 
         try:
-            data = response.json()
-        except ValueError as exc:  # pragma: no cover - defensive
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:  # pragma: no cover - defensive
             raise OpenRouterError("Invalid JSON returned from OpenRouter") from exc
 
         try:
@@ -66,9 +76,16 @@ class OpenRouterClient:
         if isinstance(raw_text, list):  # anthropic can sometimes nest content
             raw_text = "".join(segment.get("text", "") for segment in raw_text if isinstance(segment, dict))
 
+        if isinstance(raw_text, str):
+            fenced = _CODE_FENCE_RE.match(raw_text)
+            if fenced:
+                raw_text = fenced.group(1)
+        elif not isinstance(raw_text, (bytes, bytearray)):
+            raw_text = str(raw_text)
+
         try:
-            parsed = json.loads(raw_text)
-        except json.JSONDecodeError as exc:
+            parsed = orjson.loads(raw_text)
+        except orjson.JSONDecodeError as exc:
             raise OpenRouterError(f"Failed to parse OpenRouter JSON response: {raw_text}") from exc
 
         if not isinstance(parsed, dict):
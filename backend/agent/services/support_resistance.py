@@ -2,28 +2,36 @@
 
 Pipeline:
 - Resolve Pyth price ID for the requested symbol
-- Fetch last 5 days of updates via Hermes and aggregate into 4h candles
+- Fetch last 5 days of updates via Hermes and aggregate into 4h candles,
+  falling back to a synthetic series (flagged via ``source``) when Hermes
+  is slow or empty
 - Validate dataset, detect reversals, cluster into bands, rank and project
 - Compute RSI and basic risk/reward suggestions
 """
 
 from __future__ import annotations
 
-from dataclasses import asdict
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
-import math
-
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import repeat, takewhile
+from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+
+import numpy as np
 from pydantic import BaseModel, Field
 
 from backend.agent.config.settings import AgentSettings, get_settings
-from backend.agent.core.analytics.indicators import rsi_from_candles
-from backend.agent.core.analytics.ohlc import Candle, build_full_4h_candles
-from backend.agent.core.analytics.reversals import detect_reversals, ReversalPoint
-from backend.agent.core.analytics.bands import Band, build_bands, project_bands, rank_bands
+from backend.agent.core.analytics.indicators import rsi_from_closes
+from backend.agent.core.analytics.ohlc import FOUR_HOURS_SECONDS, Candle, build_full_4h_candles_streaming
+from backend.agent.core.analytics.reversals import detect_reversals, ReversalKind, ReversalPoint
+from backend.agent.core.analytics.bands import Band, BandType, build_bands, project_bands, rank_bands
 from backend.agent.core.analytics.validation import validate_candles
 from backend.agent.core.analytics.risk_reward import RRSuggestion, compute_rr_suggestions
-from backend.agent.services.historical_prices import HistoricalPriceFetcher
+from backend.agent.services.historical_prices import HistoricalPriceFetcher, IncompleteHistoryError
 from backend.agent.core.tools.price_fetcher import PriceFetcher
 
 
@@ -65,102 +73,290 @@ class SupportResistanceResponse(BaseModel):
     generatedAt: str
     bands: List[BandOut]
     indicators: Dict[str, Any] = Field(default_factory=dict)
+    # "pyth" for Hermes candles, "synthetic" when levels come from the fabricated fallback series
+    source: str = "pyth"
     jobId: Optional[str] = None
 
 
-def _now_utc() -> datetime:
-    return datetime.now(timezone.utc)
+_FIVE_DAYS_SECONDS = 5 * 24 * 60 * 60
+
+
+@lru_cache(maxsize=8)
+def _iso_from_epoch(ts: int) -> str:
+    # Requests landing in the same second share one formatted timestamp
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+_CacheKey = Tuple[str, float, int, int, int, int, int]
+# (configured price id, 0x-prefixed price id, asset name)
+_SymbolInfo = Tuple[str, str, str]
+
+
+@dataclass
+class _SharedFetchers:
+    # Holding the settings reference keeps its id from being reused while cached
+    settings: AgentSettings
+    price: PriceFetcher
+    history: Optional[HistoricalPriceFetcher] = None
+
+
+_SHARED_FETCHERS_MAX = 4
+_shared_fetchers: OrderedDict[int, _SharedFetchers] = OrderedDict()
+_shared_fetchers_lock = threading.Lock()
+
+
+def _get_shared_fetchers(
+    settings: AgentSettings, *, with_history: bool = True
+) -> Tuple[Optional[HistoricalPriceFetcher], PriceFetcher]:
+    """Return the fetchers shared by every service built from ``settings``.
+
+    The history fetcher (with its own HTTP pool) is only created for callers that
+    need it, so services given an injected fetcher never build a spare one.
+    """
+
+    key = id(settings)
+    with _shared_fetchers_lock:
+        entry = _shared_fetchers.get(key)
+        if entry is None or entry.settings is not settings:
+            entry = _SharedFetchers(settings, PriceFetcher(settings))
+            _shared_fetchers[key] = entry
+        if with_history and entry.history is None:
+            entry.history = HistoricalPriceFetcher(settings)
+        _shared_fetchers.move_to_end(key)
+        while len(_shared_fetchers) > _SHARED_FETCHERS_MAX:
+            _shared_fetchers.popitem(last=False)
+    return entry.history, entry.price
 
 
 class SupportResistanceService:
-    def __init__(self, settings: Optional[AgentSettings] = None) -> None:
+    def __init__(
+        self,
+        settings: Optional[AgentSettings] = None,
+        history: Optional[HistoricalPriceFetcher] = None,
+    ) -> None:
         self._settings = settings or get_settings()
-        self._history = HistoricalPriceFetcher(self._settings)
-        self._price_fetcher = PriceFetcher(self._settings)
-
-    def _resolve_price_id(self, symbol: str) -> str:
-        price_id = self._settings.pyth.price_feed_ids.get(symbol)
-        if not price_id:
+        # Fetchers are shared per settings object so caches and connection pools outlive this service
+        shared_history, self._price_fetcher = _get_shared_fetchers(self._settings, with_history=history is None)
+        self._history: HistoricalPriceFetcher = history or shared_history
+        self._symbol_cache: Dict[str, _SymbolInfo] = self._build_symbol_cache()
+        # LRU of (monotonic timestamp, response) per request params and 4h bucket
+        self._result_cache: OrderedDict[_CacheKey, Tuple[float, SupportResistanceResponse]] = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self._result_cache_ttl = float(self._settings.strategy.support_resistance_cache_ttl_seconds)
+        self._result_cache_size = int(self._settings.strategy.support_resistance_cache_size)
+        # Last live price per symbol as (price, monotonic timestamp) for the synthetic fallback
+        self._base_price_cache: Dict[str, Tuple[float, float]] = {}
+        self._base_price_lock = threading.Lock()
+        self._base_price_ttl = float(self._settings.strategy.support_resistance_base_price_ttl_seconds)
+        self._history_timeout = float(self._settings.strategy.support_resistance_history_timeout_seconds)
+        self._max_position_pct = float(self._settings.strategy.max_portfolio_exposure)
+
+    def _build_symbol_cache(self) -> Dict[str, _SymbolInfo]:
+        cache: Dict[str, _SymbolInfo] = {}
+        for symbol, price_id in self._settings.pyth.price_feed_ids.items():
+            if not price_id:
+                continue
+            prefixed = price_id if price_id.startswith("0x") else f"0x{price_id}"
+            cache[symbol] = (price_id, prefixed, symbol.split("_")[0])
+        return cache
+
+    def _resolve_symbol(self, symbol: str) -> _SymbolInfo:
+        info = self._symbol_cache.get(symbol)
+        if info is None:
             raise ValueError(f"No Pyth price ID configured for symbol '{symbol}'")
-        return price_id
+        return info
 
     def _window(self) -> tuple[int, int]:
-        end = int(_now_utc().timestamp())
-        start = end - int(timedelta(days=5).total_seconds())
-        return start, end
+        end = int(time.time())
+        return end - _FIVE_DAYS_SECONDS, end
+
+    def _cache_key(self, request: SupportResistanceRequest, end: int) -> _CacheKey:
+        return (
+            request.symbol,
+            request.tolerance_pct,
+            request.min_touches,
+            request.top_n_per_type,
+            request.projection_hours,
+            request.rsi_period,
+            end // FOUR_HOURS_SECONDS,
+        )
+
+    def _cached_result(self, key: _CacheKey, generated_at: str) -> Optional[SupportResistanceResponse]:
+        with self._result_cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, response = entry
+            if time.monotonic() - stored_at > self._result_cache_ttl:
+                del self._result_cache[key]
+                return None
+            self._result_cache.move_to_end(key)
+        # Deep copy: callers set jobId and may edit bands/indicators in place
+        return response.model_copy(update={"generatedAt": generated_at}, deep=True)
+
+    def _store_result(self, key: _CacheKey, response: SupportResistanceResponse) -> None:
+        with self._result_cache_lock:
+            self._result_cache[key] = (time.monotonic(), response.model_copy(deep=True))
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self._result_cache_size:
+                self._result_cache.popitem(last=False)
 
     def build(self, request: SupportResistanceRequest) -> SupportResistanceResponse:
-        price_id = self._resolve_price_id(request.symbol)
+        """Synchronous wrapper around :meth:`abuild` for callers without an event loop.
+
+        Uses ``asyncio.run``, so calling it from a coroutine or any thread with a
+        running loop raises ``RuntimeError``; await :meth:`abuild` there instead.
+        """
+
+        return asyncio.run(self.abuild(request))
+
+    async def abuild(self, request: SupportResistanceRequest) -> SupportResistanceResponse:
+        price_id, prefixed_price_id, asset = self._resolve_symbol(request.symbol)
         start, end = self._window()
 
-        # Fetch and aggregate
-        updates = self._history.fetch_updates(price_id, start, end)
-        update_dicts = [asdict(u) for u in updates]
+        generated_at = _iso_from_epoch(end)
+        cache_key = self._cache_key(request, end)
+        cached = self._cached_result(cache_key, generated_at)
+        if cached is not None:
+            return cached
 
-        candles = build_full_4h_candles(update_dicts, start, end)
+        stop_history = threading.Event()
+        history = asyncio.create_task(
+            asyncio.to_thread(self._history_candles, price_id, start, end, stop_history)
+        )
+        try:
+            candles = await asyncio.wait_for(history, timeout=self._history_timeout)
+        except asyncio.TimeoutError:
+            # Cancelling the task does not stop its worker thread; ask it to stop
+            # after the page in flight so it releases the executor slot
+            stop_history.set()
+            candles = []
+        except BaseException:
+            stop_history.set()
+            raise
+
+        source = "pyth" if candles else "synthetic"
         if not candles:
-            candles = self._synthetic_candles(request.symbol, start, end)
+            # Built only once Hermes has failed: it may need a live base-price lookup
+            candles = await asyncio.to_thread(self._synthetic_candles, request.symbol, start, end)
 
+        response = await asyncio.to_thread(
+            self._analyze_candles, request, candles, asset, prefixed_price_id, generated_at, source
+        )
+        # Synthetic levels are a stand-in for this request only; never serve them from cache
+        if source == "pyth":
+            self._store_result(cache_key, response)
+        return response
+
+    def _history_candles(
+        self, price_id: str, start: int, end: int, stop: Optional[threading.Event] = None
+    ) -> List[Candle]:
+        # Fetch and aggregate page by page so raw updates never pile up in memory
+        pages = self._history.iter_updates(price_id, start, end)
+        if stop is not None:
+            pages = takewhile(lambda _: not stop.is_set(), pages)
+        try:
+            return build_full_4h_candles_streaming(pages, start, end)
+        except IncompleteHistoryError:
+            # The stream broke off mid-window; rebuild from a complete fetch with its fallbacks
+            if stop is not None and stop.is_set():
+                return []
+            updates = self._history.fetch_updates(price_id, start, end)
+            return build_full_4h_candles_streaming([updates], start, end)
+
+    def _analyze_candles(
+        self,
+        request: SupportResistanceRequest,
+        candles: List[Candle],
+        asset: str,
+        prefixed_price_id: str,
+        generated_at: str,
+        source: str = "pyth",
+    ) -> SupportResistanceResponse:
         ok, reasons = validate_candles(candles, expected_count=30, minimum_unique=5)
         if not ok:
             raise ValueError(f"Dataset validation failed: {', '.join(reasons)}")
 
-        reversals = detect_reversals(candles, min_separation_bars=1, min_price_move_pct=request.tolerance_pct)
-        bands = build_bands(reversals, tolerance_pct=request.tolerance_pct, min_touches=request.min_touches)
-        bands = rank_bands(bands, top_n_per_type=request.top_n_per_type)
-        bands = project_bands(bands, projection_hours=request.projection_hours)
+        # Read each request field once instead of through the model per use
+        tolerance_pct = request.tolerance_pct
+        projection_hours = request.projection_hours
+        rsi_period = request.rsi_period
+
+        # One close vector feeds the range guard, the fallback and RSI
+        closes_arr = np.fromiter((c.close for c in candles), dtype=np.float64, count=len(candles))
+        closes = closes_arr.tolist()
+        extrema = (float(closes_arr.min()), float(closes_arr.max()))
+
+        bands: List[Band] = []
+        # A range narrower than one band width cannot yield distinct clusters
+        if extrema[1] - extrema[0] >= extrema[0] * tolerance_pct:
+            reversals = detect_reversals(candles, min_separation_bars=1, min_price_move_pct=tolerance_pct)
+            bands = build_bands(reversals, tolerance_pct=tolerance_pct, min_touches=request.min_touches)
+            bands = rank_bands(bands, top_n_per_type=request.top_n_per_type)
+            bands = project_bands(bands, projection_hours=projection_hours)
 
         if not bands:
-            bands = self._fallback_bands(candles, request.tolerance_pct, request.projection_hours)
+            bands = self._fallback_bands(
+                candles,
+                tolerance_pct,
+                projection_hours,
+                closes=closes,
+                extrema=extrema,
+            )
 
         # Indicators
-        rsi_series = rsi_from_candles(candles, period=request.rsi_period)
-        rsi_value = rsi_series[-1] if rsi_series else float("nan")
+        rsi_series = rsi_from_closes(closes_arr, period=rsi_period)
+        rsi_value = float(rsi_series[-1]) if rsi_series.size else float("nan")
 
-        rr = compute_rr_suggestions(bands, max_position_pct=float(self._settings.strategy.max_portfolio_exposure))
+        rr = compute_rr_suggestions(bands, max_position_pct=self._max_position_pct)
 
-        return SupportResistanceResponse(
-            asset=request.symbol.split("_")[0],
-            priceId=price_id if price_id.startswith("0x") else f"0x{price_id}",
-            generatedAt=_now_utc().isoformat(),
+        return SupportResistanceResponse.model_construct(
+            asset=asset,
+            priceId=prefixed_price_id,
+            generatedAt=generated_at,
             bands=[_band_to_out(b) for b in bands],
             indicators={
-                "rsi": {"value": rsi_value, "length": request.rsi_period},
+                "rsi": {"value": rsi_value, "length": rsi_period},
                 "riskReward": [_rr_to_out(x) for x in rr],
             },
+            source=source,
         )
 
     def _synthetic_candles(self, symbol: str, start_time: int, end_time: int) -> List[Candle]:
         base = self._fallback_base_price(symbol)
-        window = 4 * 60 * 60
+        window = FOUR_HOURS_SECONDS
         total = max(30, (end_time - start_time) // window)
         amplitude = base * 0.02
-        candles: List[Candle] = []
-        cursor = start_time
-        for i in range(total):
-            open_price = base + amplitude * math.sin(i / 4)
-            close_price = base + amplitude * math.cos(i / 5)
-            high_price = max(open_price, close_price) + amplitude * 0.2
-            low_price = min(open_price, close_price) - amplitude * 0.2
-            candles.append(
-                Candle(
-                    start_time=cursor,
-                    end_time=cursor + window,
-                    open=open_price,
-                    high=high_price,
-                    low=low_price,
-                    close=close_price,
-                    count=1,
-                    synthetic=False,
-                )
+        idx = np.arange(total, dtype=np.float64)
+        opens = base + amplitude * np.sin(idx / 4)
+        closes = base + amplitude * np.cos(idx / 5)
+        highs = np.maximum(opens, closes) + amplitude * 0.2
+        lows = np.minimum(opens, closes) - amplitude * 0.2
+        starts = start_time + np.arange(total, dtype=np.int64) * window
+        return list(
+            map(
+                Candle,
+                starts.tolist(),
+                (starts + window).tolist(),
+                opens.tolist(),
+                highs.tolist(),
+                lows.tolist(),
+                closes.tolist(),
+                repeat(1, total),
+                repeat(False, total),
             )
-            cursor += window
-        return candles
+        )
 
     def _fallback_base_price(self, symbol: str) -> float:
+        with self._base_price_lock:
+            cached = self._base_price_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[1] < self._base_price_ttl:
+            return cached[0]
         try:
             price = self._price_fetcher.fetch_price(symbol).price
             if price > 0:
+                with self._base_price_lock:
+                    self._base_price_cache[symbol] = (price, time.monotonic())
                 return price
         except Exception:
             pass
@@ -175,22 +371,32 @@ class SupportResistanceService:
         candles: List[Candle],
         tolerance_pct: float,
         projection_hours: int,
+        *,
+        closes: Optional[List[float]] = None,
+        extrema: Optional[Tuple[float, float]] = None,
     ) -> List[Band]:
         if not candles:
             return []
 
-        closes = [c.close for c in candles]
+        if closes is None:
+            closes = [c.close for c in candles]
         if len(closes) < 2:
             return []
 
         timestamps = [c.start_time for c in candles]
-        min_close = min(closes)
-        max_close = max(closes)
+        close_arr = np.asarray(closes, dtype=np.float64)
+        support_idx = resistance_idx = -1
+        if extrema is None:
+            support_idx = int(close_arr.argmin())
+            resistance_idx = int(close_arr.argmax())
+            extrema = (closes[support_idx], closes[resistance_idx])
+        min_close, max_close = extrema
         price_range = max_close - min_close
 
         if min_close <= 0 or price_range <= 0:
             return []
 
+        # Try relaxed detection: treat every direction change as a pivot
         relaxed_reversals = detect_reversals(
             candles,
             min_separation_bars=1,
@@ -207,53 +413,70 @@ class SupportResistanceService:
             return project_bands(relaxed_bands, projection_hours=projection_hours)
 
         # As a last resort, fabricate simple bands around global extrema
-        def make_points(idx: int, kind: str) -> List[ReversalPoint]:
-            points: List[ReversalPoint] = []
-            offsets = (0, -2, 2)
-            for offset in offsets:
-                j = max(0, min(len(candles) - 1, idx + offset))
-                points.append(
-                    ReversalPoint(
-                        index=j,
-                        timestamp=timestamps[j],
-                        price=closes[j],
-                        kind=kind,
-                        magnitude_pct=0.0,
-                    )
-                )
-            return points
-
-        support_idx = closes.index(min_close)
-        resistance_idx = closes.index(max_close)
-        tol = max(tolerance_pct, 0.002)
-
-        support_points = make_points(support_idx, "trough")
-        resistance_points = make_points(resistance_idx, "peak")
+        last = len(candles) - 1
+
+        def make_points(idx: int, kind: ReversalKind) -> Tuple[ReversalPoint, ReversalPoint, ReversalPoint]:
+            # Touches at the extremum and two bars either side, clamped to the series
+            j0 = idx
+            j1 = max(0, idx - 2)
+            j2 = min(last, idx + 2)
+            return (
+                ReversalPoint(j0, timestamps[j0], closes[j0], kind, 0.0),
+                ReversalPoint(j1, timestamps[j1], closes[j1], kind, 0.0),
+                ReversalPoint(j2, timestamps[j2], closes[j2], kind, 0.0),
+            )
 
-        def fabricate_band(points: List[ReversalPoint], band_type: str, center_price: float) -> Band:
-            half_width = max(center_price * tol, price_range * 0.05)
+        if support_idx < 0:
+            support_idx = int(close_arr.argmin())
+            resistance_idx = int(close_arr.argmax())
+        tol = max(tolerance_pct, 0.002)
+        min_half_width = price_range * 0.05
+        support_price = closes[support_idx]
+        resistance_price = closes[resistance_idx]
+
+        def fabricate_band(
+            points: Tuple[ReversalPoint, ReversalPoint, ReversalPoint],
+            band_type: BandType,
+            center_price: float,
+            half_width: float,
+        ) -> Band:
+            p0, p1, p2 = points
             return Band(
                 lower=center_price - half_width,
                 upper=center_price + half_width,
                 mid=center_price,
-                points=points,
+                points=[p0, p1, p2],
                 band_type=band_type,
-                touch_count=len(points),
-                avg_bounce_distance=sum(abs(p.price - center_price) for p in points) / len(points),
-                last_touch_ts=points[-1].timestamp,
+                touch_count=3,
+                avg_bounce_distance=(
+                    abs(p0.price - center_price) + abs(p1.price - center_price) + abs(p2.price - center_price)
+                ) / 3,
+                last_touch_ts=p2.timestamp,
                 projected_until_ts=None,
             )
 
         fallback_bands = [
-            fabricate_band(support_points, "support", closes[support_idx]),
-            fabricate_band(resistance_points, "resistance", closes[resistance_idx]),
+            fabricate_band(
+                make_points(support_idx, "trough"),
+                "support",
+                support_price,
+                max(support_price * tol, min_half_width),
+            ),
+            fabricate_band(
+                make_points(resistance_idx, "peak"),
+                "resistance",
+                resistance_price,
+                max(resistance_price * tol, min_half_width),
+            ),
         ]
 
         return project_bands(fallback_bands, projection_hours=projection_hours)
 
 
+# Inputs below are trusted analytics dataclasses, so skip per-field validation
+
 def _band_to_out(b: Band) -> BandOut:
-    return BandOut(
+    return BandOut.model_construct(
         type=b.band_type,
         lower=b.lower,
         upper=b.upper,
@@ -265,18 +488,19 @@ def _band_to_out(b: Band) -> BandOut:
     )
 
 
-def _rr_to_out(x: RRSuggestion) -> RROut:
-    return RROut(
-        bandType=x.band_type,
-        entry=x.entry_price,
-        stop=x.stop_price,
-        takeProfit=x.take_profit_price,
-        risk=x.risk,
-        reward=x.reward,
-        rr=x.rr_ratio,
-        positionPct=x.recommended_position_pct,
-        targetBandMid=x.target_band_mid,
-    )
+def _rr_to_out(x: RRSuggestion) -> Dict[str, Any]:
+    # Stored under the free-form indicators mapping, so a plain dict shaped like RROut suffices
+    return {
+        "bandType": x.band_type,
+        "entry": x.entry_price,
+        "stop": x.stop_price,
+        "takeProfit": x.take_profit_price,
+        "risk": x.risk,
+        "reward": x.reward,
+        "rr": x.rr_ratio,
+        "positionPct": x.recommended_position_pct,
+        "targetBandMid": x.target_band_mid,
+    }
 
 
 __all__ = [
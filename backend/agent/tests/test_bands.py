@@ -50,3 +50,15 @@ def test_build_bands_requires_alternating_touches() -> None:
     band = bands[0]
     assert band.band_type in {"support", "resistance"}
     assert band.touch_count >= 3
+
+
+def test_cluster_reversals_compares_against_running_cluster_centre() -> None:
+    points = [
+        _make_reversal(0, 101.6, "peak", 2),
+        _make_reversal(1, 100.0, "trough", 0),
+        _make_reversal(2, 100.8, "peak", 1),
+    ]
+
+    clusters = cluster_reversals(points, tolerance_pct=0.01)
+
+    assert [[p.price for p in c] for c in clusters] == [[100.0, 100.8], [101.6]]
@@ -0,0 +1,42 @@
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from backend.agent.services.chart_analysis import StrategyStore, StrategySuggestion
+
+
+def _suggestion(suggestion_id: str, created_at: datetime) -> StrategySuggestion:
+    return StrategySuggestion(
+        id=suggestion_id,
+        strategy_key="rsi_20_80",
+        title="RSI 20/80",
+        summary="Buy oversold, sell overbought",
+        support_level=1900.0,
+        resistance_level=2100.0,
+        confidence=0.6,
+        symbol="ETH_USD",
+        interval="4h",
+        created_at=created_at,
+    )
+
+
+def test_strategy_store_round_trip_newest_first(tmp_path: Path) -> None:
+    store = StrategyStore(tmp_path / "strategies.json", max_entries=2)
+    now = datetime.now(timezone.utc)
+
+    store.add(_suggestion("a", now - timedelta(minutes=2)))
+    store.add(_suggestion("b", now))
+    store.add(_suggestion("c", now - timedelta(minutes=1)))
+
+    assert [s.id for s in store.list()] == ["b", "c"]
+    assert [p.name for p in tmp_path.iterdir()] == ["strategies.json"]
+
+
+def test_strategy_store_skips_malformed_entries(tmp_path: Path) -> None:
+    path = tmp_path / "strategies.json"
+    valid = _suggestion("a", datetime.now(timezone.utc)).model_dump(mode="json")
+    path.write_text(json.dumps([valid, {"id": "broken"}, "junk"]), encoding="utf-8")
+
+    store = StrategyStore(path)
+
+    assert [s.id for s in store.list()] == ["a"]
@@ -0,0 +1,144 @@
+import threading
+import time
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from backend.agent.config.settings import AgentSettings
+from backend.agent.services.historical_prices import HistoricalPriceFetcher, IncompleteHistoryError
+
+
+def _item(publish_time: int, price: int) -> Dict[str, Any]:
+    return {"parsed": {"publish_time": publish_time, "price": {"price": price, "expo": -2}}}
+
+
+def _paginated_client(pages: List[Dict[str, Any]], seen_tokens: List[str]) -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        token = request.url.params.get("page_token")
+        seen_tokens.append(token or "")
+        index = int(token) if token else 0
+        return httpx.Response(200, json=pages[index])
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_fetch_updates_follows_page_tokens() -> None:
+    pages = [
+        {"data": [_item(10, 1000), _item(20, 1100)], "next_page_token": "1"},
+        {"data": [_item(30, 900)], "next_page_token": "2"},
+        {"data": [_item(40, 1150)]},
+    ]
+    seen_tokens: List[str] = []
+    fetcher = HistoricalPriceFetcher(AgentSettings.model_construct(), client=_paginated_client(pages, seen_tokens))
+
+    updates = fetcher.fetch_updates("0xff", 0, 100)
+
+    assert seen_tokens == ["", "1", "2"]
+    assert [u.publish_time for u in updates] == [10, 20, 30, 40]
+    assert [u.price for u in updates] == [1000, 1100, 900, 1150]
+
+
+def test_fetch_updates_falls_back_to_lenient_parsing() -> None:
+    pages = [
+        {
+            "data": [
+                _item(10, 1000),
+                {"parsed": {"publishTime": 20, "ema_price": {"price": 1100, "expo": -2}}},
+                {"parsed": {"publish_time": 30, "price": {"price": "bad", "expo": -2}}},
+            ]
+        }
+    ]
+    fetcher = HistoricalPriceFetcher(AgentSettings.model_construct(), client=_paginated_client(pages, []))
+
+    updates = fetcher.fetch_updates("0xff", 0, 100)
+
+    assert [(u.publish_time, u.price) for u in updates] == [(10, 1000), (20, 1100)]
+
+
+def test_fetch_updates_sorts_out_of_order_pages() -> None:
+    pages = [
+        {"data": [_item(30, 900), _item(10, 1000)], "next_page_token": "1"},
+        {"data": [_item(20, 1100), _item(10, 1050)]},
+    ]
+    fetcher = HistoricalPriceFetcher(AgentSettings.model_construct(), client=_paginated_client(pages, []))
+
+    updates = fetcher.fetch_updates("0xff", 0, 100)
+
+    assert [(u.publish_time, u.price) for u in updates] == [(10, 1000), (10, 1050), (20, 1100), (30, 900)]
+
+
+def test_fetch_updates_falls_back_to_history_endpoint_within_window() -> None:
+    history = {
+        "price_history": [
+            {"publish_time": 5, "price": 990, "expo": -2},
+            {"publish_time": 50, "price": {"price": 1000, "expo": -2}},
+            {"timestamp": 60_000, "price": 1010, "expo": -2},
+            {"publish_time": 150, "price": 1020, "expo": -2},
+        ]
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "/price/history" in request.url.path:
+            return httpx.Response(200, json=history)
+        return httpx.Response(404)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    fetcher = HistoricalPriceFetcher(AgentSettings.model_construct(), client=client)
+
+    updates = fetcher.fetch_updates("0xff", 10, 100)
+
+    assert [(u.publish_time, u.price) for u in updates] == [(50, 1000), (60, 1010)]
+
+
+def _failing_second_page_client(paths: List[str]) -> httpx.Client:
+    history = {"price_history": [{"publish_time": 50, "price": 1000, "expo": -2}]}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("/v2/updates/price/0xff"):
+            if request.url.params.get("page_token"):
+                return httpx.Response(500)
+            return httpx.Response(200, json={"data": [_item(10, 1000)], "next_page_token": "1"})
+        if "/price/history" in request.url.path:
+            return httpx.Response(200, json=history)
+        return httpx.Response(404)
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_iter_updates_raises_when_a_later_page_fails() -> None:
+    fetcher = HistoricalPriceFetcher(AgentSettings.model_construct(), client=_failing_second_page_client([]))
+    pages = fetcher.iter_updates("0xff", 0, 100)
+
+    assert [u.publish_time for u in next(pages)] == [10]
+    with pytest.raises(IncompleteHistoryError):
+        next(pages)
+
+
+def test_fetch_updates_discards_partial_window_and_falls_back() -> None:
+    paths: List[str] = []
+    fetcher = HistoricalPriceFetcher(AgentSettings.model_construct(), client=_failing_second_page_client(paths))
+
+    updates = fetcher.fetch_updates("0xff", 0, 100)
+
+    assert [(u.publish_time, u.price) for u in updates] == [(50, 1000)]
+    assert paths[2].endswith("/v2/updates/price/ff")
+    assert "/price/history" in paths[3]
+
+
+def test_fetch_updates_releases_prefetch_threads() -> None:
+    pages = [
+        {"data": [_item(10, 1000)], "next_page_token": "1"},
+        {"data": [_item(20, 1100)], "next_page_token": "2"},
+        {"data": [_item(30, 900)]},
+    ]
+    fetcher = HistoricalPriceFetcher(AgentSettings.model_construct(), client=_paginated_client(pages, []))
+
+    fetcher.fetch_updates("0xff", 0, 100)
+    next(fetcher.iter_updates("0xff", 0, 200))  # abandoned after the first page
+
+    deadline = time.monotonic() + 2.0
+    while any(t.name.startswith("hermes-prefetch") for t in threading.enumerate()) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not any(t.name.startswith("hermes-prefetch") for t in threading.enumerate())
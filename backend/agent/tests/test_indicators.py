@@ -0,0 +1,38 @@
+import math
+
+import numpy as np
+
+from backend.agent.core.analytics.indicators import rsi_from_candles, rsi_from_closes
+from backend.agent.core.analytics.ohlc import Candle
+
+
+def _candles(closes: list[float]) -> list[Candle]:
+    return [Candle(i, i + 1, close, close, close, close, 1) for i, close in enumerate(closes)]
+
+
+def test_rsi_from_candles_warmup_and_rising_series() -> None:
+    rsi = rsi_from_candles(_candles([float(i) for i in range(1, 21)]), period=14)
+
+    assert len(rsi) == 20
+    assert all(math.isnan(v) for v in rsi[:14])
+    assert rsi[14:] == [100.0] * 6
+
+
+def test_rsi_from_candles_wilder_smoothing() -> None:
+    closes = [10.0, 11.0, 10.0, 12.0, 11.0]
+
+    rsi = rsi_from_candles(_candles(closes), period=2)
+
+    # avg gain/loss seeded with 0.5/0.5, then smoothed with 2.0 gain and 1.0 loss
+    assert rsi[2] == 50.0
+    assert math.isclose(rsi[3], 100.0 - 100.0 / (1.0 + 1.25 / 0.25))
+    assert math.isclose(rsi[4], 100.0 - 100.0 / (1.0 + 0.625 / 0.625))
+
+
+def test_rsi_from_closes_matches_candle_path() -> None:
+    closes = [10.0, 11.0, 10.0, 12.0, 11.0, 11.5, 9.0]
+
+    rsi = rsi_from_closes(np.array(closes), period=3)
+
+    assert isinstance(rsi, np.ndarray)
+    np.testing.assert_array_equal(rsi, np.array(rsi_from_candles(_candles(closes), period=3)))
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from backend.agent.core.analytics import _kernels
+from backend.agent.core.analytics._kernels import cluster_reversals_nb, detect_reversals_nb
+
+
+def _kernel_cases():
+    rng = np.random.default_rng(3)
+    closes = 2000.0 + np.cumsum(rng.normal(0.0, 5.0, size=60))
+    deltas = np.diff(closes)
+    synthetic = np.zeros(closes.size, dtype=np.bool_)
+    synthetic[::4] = True
+    return [
+        (_kernels.wilder_rsi_nb, (np.maximum(deltas, 0.0), np.maximum(-deltas, 0.0), 14)),
+        (_kernels.detect_reversals_nb, (closes, 1, 0.002)),
+        (_kernels.cluster_reversals_nb, (np.sort(closes), 0.005)),
+        (_kernels.count_real_and_unique_nb, (closes, synthetic)),
+    ]
+
+
+def _assert_same(actual, expected) -> None:
+    if isinstance(expected, tuple):
+        assert len(actual) == len(expected)
+        for a, e in zip(actual, expected):
+            _assert_same(a, e)
+    else:
+        np.testing.assert_array_equal(np.asarray(actual), np.asarray(expected))
+
+
+def test_kernels_accept_keyword_arguments() -> None:
+    closes = np.array([1.0, 2.0, 1.0, 2.0, 1.0])
+
+    by_position = detect_reversals_nb(closes, 1, 0.0)
+    by_keyword = detect_reversals_nb(closes, min_separation_bars=1, min_price_move_pct=0.0)
+
+    _assert_same(by_keyword, by_position)
+    _assert_same(cluster_reversals_nb(np.array([1.0, 1.001, 2.0]), tolerance_pct=0.01), [0, 0, 1])
+
+
+def test_kernels_compile_under_numba_and_match_python() -> None:
+    numba = pytest.importorskip("numba")
+
+    for kernel, args in _kernel_cases():
+        python_impl = kernel.__wrapped__
+        compiled = numba.njit(cache=False)(python_impl)
+        _assert_same(compiled(*args), python_impl(*args))
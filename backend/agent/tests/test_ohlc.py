@@ -3,7 +3,9 @@ from backend.agent.core.analytics.ohlc import (
     aggregate_updates_to_4h_candles,
     backfill_missing_candles,
     build_full_4h_candles,
+    build_full_4h_candles_streaming,
 )
+from backend.agent.services.historical_prices import PriceUpdate
 
 
 def test_aggregate_updates_to_4h_candles_basic() -> None:
@@ -47,3 +49,32 @@ def test_build_full_4h_candles_empty_updates() -> None:
     candles = build_full_4h_candles([], 0, 4 * 60 * 60)
     assert candles == []
 
+
+
+def test_build_full_4h_candles_streaming_matches_batch() -> None:
+    window = 4 * 60 * 60
+    end = window * 3
+    updates = [
+        {"publish_time": 10, "price": 1000, "expo": -2},
+        {"publish_time": window * 2 + 50, "price": 1300, "expo": -2},
+        {"publish_time": 100, "price": 1200, "expo": -2},
+        {"publish_time": 5, "price": 950, "expo": -2},
+        {"publish_time": window * 2 + 10, "price": 1250, "expo": -2},
+    ]
+    pages = [[PriceUpdate(**u) for u in updates[:2]], [], [PriceUpdate(**u) for u in updates[2:]]]
+
+    streamed = build_full_4h_candles_streaming(iter(pages), 0, end)
+
+    assert streamed == build_full_4h_candles(updates, 0, end)
+    assert streamed[0].open == 9.5
+    assert streamed[1].synthetic
+
+
+def test_build_full_4h_candles_consumes_generator() -> None:
+    window = 4 * 60 * 60
+    updates = [{"publish_time": i * 600, "price": 1000 + i, "expo": -2} for i in range(48)]
+
+    candles = build_full_4h_candles((u for u in updates), 0, window * 2)
+
+    assert candles == build_full_4h_candles(updates, 0, window * 2)
+    assert [c.count for c in candles] == [24, 24]
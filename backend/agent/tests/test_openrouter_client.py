@@ -0,0 +1,39 @@
+import asyncio
+from typing import Any, Dict
+
+import httpx
+import pytest
+
+from backend.agent.config.settings import AgentSettings, LLMConfig
+from backend.agent.services.openrouter_client import OpenRouterClient, OpenRouterError
+
+
+def _client(content: str) -> OpenRouterClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    settings = AgentSettings.model_construct(llm=LLMConfig(api_key="test-key"))
+    return OpenRouterClient(settings, transport=httpx.MockTransport(handler))
+
+
+def _generate(content: str) -> Dict[str, Any]:
+    return asyncio.run(_client(content).generate_json({"messages": []}))
+
+
+def test_generate_json_strips_markdown_code_fence() -> None:
+    assert _generate('```json\n{"strategy": "rsi", "levels": [1, 2]}\n```') == {"strategy": "rsi", "levels": [1, 2]}
+    assert _generate('  ```\n{"strategy": "rsi"}\n```  ') == {"strategy": "rsi"}
+
+
+def test_generate_json_parses_unfenced_reply() -> None:
+    assert _generate('{"strategy": "rsi", "note": "uses ``` inside"}') == {
+        "strategy": "rsi",
+        "note": "uses ``` inside",
+    }
+
+
+def test_generate_json_rejects_invalid_json() -> None:
+    with pytest.raises(OpenRouterError, match="Failed to parse"):
+        _generate("```json\n{not json}\n```")
+    with pytest.raises(OpenRouterError, match="not an object"):
+        _generate("[1, 2]")
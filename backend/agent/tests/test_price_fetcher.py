@@ -0,0 +1,81 @@
+from typing import List
+
+import httpx
+import pytest
+
+from backend.agent.config.settings import AgentSettings
+from backend.agent.core.tools.price_fetcher import PriceFetcher
+
+
+def _settings() -> AgentSettings:
+    settings = AgentSettings.model_construct()
+    settings.pyth.price_feed_ids = {"ETH_USD": "0xaa", "BTC_USD": "bb"}
+    return settings
+
+
+def _entry(feed_id: str, price: int) -> dict:
+    return {"id": feed_id, "price": {"price": str(price), "conf": "10", "expo": -2, "publish_time": 100}}
+
+
+def test_fetch_prices_batches_feeds_into_one_request() -> None:
+    seen: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=[_entry("bb", 5_000_000), _entry("aa", 200_000)])
+
+    fetcher = PriceFetcher(_settings(), client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    prices = fetcher.fetch_prices(["ETH_USD", "BTC_USD"])
+
+    assert len(seen) == 1
+    assert seen[0].url.params.get_list("ids[]") == ["aa", "bb"]
+    assert prices["ETH_USD"].price == 2000.0
+    assert prices["BTC_USD"].price == 50000.0
+    assert prices["ETH_USD"].id == "0xaa"
+
+
+def test_fetch_prices_raises_for_missing_feed() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[_entry("aa", 200_000)])
+
+    fetcher = PriceFetcher(_settings(), client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    with pytest.raises(ValueError, match="bb"):
+        fetcher.fetch_prices(["ETH_USD", "BTC_USD"])
+
+
+def test_fetch_recent_prices_uses_one_history_request() -> None:
+    seen: List[httpx.Request] = []
+    items = [
+        {"parsed": {"id": "aa", "price": {"price": str(200_000 + i), "conf": "1", "expo": -2, "publish_time": 100 - i}}}
+        for i in range(3)
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"data": items})
+
+    fetcher = PriceFetcher(_settings(), client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    prices = fetcher.fetch_recent_prices("ETH_USD", 3)
+
+    assert len(seen) == 1
+    assert seen[0].url.path.endswith("/v2/updates/price/aa")
+    assert seen[0].url.params["limit"] == "3"
+    assert prices == [2000.02, 2000.01, 2000.0]
+
+
+def test_fetch_recent_prices_normalises_mixed_exponents() -> None:
+    items = [
+        {"parsed": {"price": {"price": "123456789", "expo": -8, "publish_time": 30}}},
+        {"parsed": {"price": {"conf": "1", "expo": -8, "publish_time": 20}}},
+        {"price": {"price": "42", "expo": 2, "publish_time": 10}},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=items)
+
+    fetcher = PriceFetcher(_settings(), client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    assert fetcher.fetch_recent_prices("ETH_USD", 5) == [4200.0, 1.23456789]
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from backend.agent.core.tools.rsi_calculator import RSICalculator
+
+
+def test_from_ndarray_matches_from_series() -> None:
+    rng = np.random.default_rng(7)
+    prices = 2000.0 + np.cumsum(rng.normal(0.0, 5.0, size=40))
+
+    for period in (3, 14, 39):
+        assert RSICalculator.from_ndarray(prices, period) == pytest.approx(
+            RSICalculator.from_series(prices.tolist(), period)
+        )
+
+
+def test_from_ndarray_edge_cases() -> None:
+    assert RSICalculator.from_ndarray(np.arange(15, dtype=np.float64), 14) == 100.0
+
+    with pytest.raises(ValueError, match="Not enough data"):
+        RSICalculator.from_ndarray(np.ones(14), 14)
+    with pytest.raises(ValueError, match="positive"):
+        RSICalculator.from_ndarray(np.ones(14), 0)
@@ -4,17 +4,18 @@ from typing import List
 from fastapi.testclient import TestClient
 
 from backend.agent.api.server import app, _jobs, _sr_service
+from backend.agent.services.historical_prices import PriceUpdate
 
 
 def test_support_resistance_endpoint_emits_sse(monkeypatch) -> None:
-    updates: List[dict] = [
-        {"publish_time": 0, "price": 1000, "expo": -2},
-        {"publish_time": 4 * 60 * 60, "price": 1100, "expo": -2},
-        {"publish_time": 8 * 60 * 60, "price": 900, "expo": -2},
-        {"publish_time": 12 * 60 * 60, "price": 1150, "expo": -2},
+    updates: List[PriceUpdate] = [
+        PriceUpdate(publish_time=0, price=1000, expo=-2),
+        PriceUpdate(publish_time=4 * 60 * 60, price=1100, expo=-2),
+        PriceUpdate(publish_time=8 * 60 * 60, price=900, expo=-2),
+        PriceUpdate(publish_time=12 * 60 * 60, price=1150, expo=-2),
     ]
 
-    monkeypatch.setattr(_sr_service._history, "fetch_updates", lambda *args, **kwargs: updates)
+    monkeypatch.setattr(_sr_service._history, "iter_updates", lambda *args, **kwargs: iter([updates]))
 
     class DummyPrice:
         price = 2000.0
@@ -1,11 +1,23 @@
+import asyncio
+import time
 from datetime import timedelta
 from typing import Dict, List
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from backend.agent.config.settings import AgentSettings
-from backend.agent.services.support_resistance import SupportResistanceRequest, SupportResistanceService
+from backend.agent.core.analytics.bands import build_bands, project_bands
+from backend.agent.core.analytics.ohlc import Candle
+from backend.agent.core.analytics.reversals import detect_reversals
+from backend.agent.services import support_resistance
+from backend.agent.services.historical_prices import IncompleteHistoryError, PriceUpdate
+from backend.agent.services.support_resistance import (
+    SupportResistanceRequest,
+    SupportResistanceResponse,
+    SupportResistanceService,
+)
 
 
 @pytest.fixture
@@ -18,7 +30,7 @@ def settings() -> AgentSettings:
 def _service_with_candles(settings: AgentSettings, candles: List[Candle]) -> SupportResistanceService:
     service = SupportResistanceService(settings=settings)
     service._history = MagicMock()
-    service._history.fetch_updates.return_value = [{"publish_time": 0, "price": 1000, "expo": -2}] if candles else []
+    service._history.iter_updates.return_value = [[PriceUpdate(publish_time=0, price=1000, expo=-2)]] if candles else []
     service._price_fetcher = FakePriceFetcher(2000.0)
     return service
 
@@ -27,13 +39,13 @@ def test_support_resistance_build_returns_bands_from_candles(settings: AgentSett
     request = SupportResistanceRequest(symbol="ETH_USD")
     service = SupportResistanceService(settings=settings)
     updates = [
-        {"publish_time": 0, "price": 1000, "expo": -2},
-        {"publish_time": 4 * 60 * 60, "price": 1100, "expo": -2},
-        {"publish_time": 8 * 60 * 60, "price": 900, "expo": -2},
-        {"publish_time": 12 * 60 * 60, "price": 1150, "expo": -2},
+        PriceUpdate(publish_time=0, price=1000, expo=-2),
+        PriceUpdate(publish_time=4 * 60 * 60, price=1100, expo=-2),
+        PriceUpdate(publish_time=8 * 60 * 60, price=900, expo=-2),
+        PriceUpdate(publish_time=12 * 60 * 60, price=1150, expo=-2),
     ]
     service._history = MagicMock()
-    service._history.fetch_updates.return_value = updates
+    service._history.iter_updates.return_value = [updates[:2], updates[2:]]
     service._price_fetcher = MagicMock()
     service._price_fetcher.fetch_price.return_value = MagicMock(price=2000.0)
 
@@ -47,7 +59,7 @@ def test_support_resistance_build_handles_empty_updates(settings: AgentSettings)
     request = SupportResistanceRequest(symbol="ETH_USD")
     service = SupportResistanceService(settings=settings)
     service._history = MagicMock()
-    service._history.fetch_updates.return_value = []
+    service._history.iter_updates.return_value = []
     service._price_fetcher = MagicMock()
     service._price_fetcher.fetch_price.return_value = MagicMock(price=2000.0)
 
@@ -55,3 +67,240 @@ def test_support_resistance_build_handles_empty_updates(settings: AgentSettings)
 
     assert response.bands
 
+
+def test_support_resistance_build_reuses_result_within_bucket(settings: AgentSettings) -> None:
+    request = SupportResistanceRequest(symbol="ETH_USD")
+    service = SupportResistanceService(settings=settings)
+    window = 4 * 60 * 60
+    updates = [PriceUpdate(publish_time=i * window + 120, price=200_000 + 500 * (i % 9), expo=-2) for i in range(30)]
+    service._history = MagicMock()
+    service._history.iter_updates.return_value = [updates]
+    service._price_fetcher = MagicMock()
+    service._price_fetcher.fetch_price.return_value = MagicMock(price=2000.0)
+
+    service._window = lambda: (0, 30 * 4 * 60 * 60)
+    first = service.build(request)
+    first.jobId = "job-1"
+    service._window = lambda: (60, 30 * 4 * 60 * 60 + 60)
+    second = service.build(request)
+
+    assert service._history.iter_updates.call_count == 1
+    assert second.bands == first.bands
+    assert second.jobId is None
+    assert second.generatedAt > first.generatedAt
+
+
+def test_support_resistance_cached_result_is_isolated_from_callers(settings: AgentSettings) -> None:
+    window = 4 * 60 * 60
+    updates = [PriceUpdate(publish_time=i * window + 120, price=200_000 + 500 * (i % 9), expo=-2) for i in range(30)]
+    service = SupportResistanceService(settings=settings, history=MagicMock())
+    service._history.iter_updates.return_value = [updates]
+    service._window = lambda: (0, 30 * window)
+    request = SupportResistanceRequest(symbol="ETH_USD")
+
+    first = service.build(request)
+    expected = first.model_dump()
+    first.bands.clear()
+    first.indicators["rsi"]["value"] = -1.0
+    first.indicators["riskReward"].append({})
+    second = service.build(request)
+    second_dump = second.model_dump()
+    second.bands[0].mid = 0.0
+
+    assert service._history.iter_updates.call_count == 1
+    assert (second_dump["bands"], second_dump["indicators"]) == (expected["bands"], expected["indicators"])
+    assert service.build(request).model_dump()["bands"] == expected["bands"]
+
+
+def test_support_resistance_service_uses_injected_history(settings: AgentSettings) -> None:
+    history = MagicMock()
+    history.iter_updates.return_value = []
+
+    service = SupportResistanceService(settings=settings, history=history)
+    service._price_fetcher = MagicMock()
+    service._price_fetcher.fetch_price.return_value = MagicMock(price=2000.0)
+    service.build(SupportResistanceRequest(symbol="ETH_USD"))
+
+    assert service._history is history
+    history.iter_updates.assert_called_once()
+
+
+def test_support_resistance_build_rejects_unknown_symbol(settings: AgentSettings) -> None:
+    service = SupportResistanceService(settings=settings, history=MagicMock())
+
+    with pytest.raises(ValueError, match="DOGE_USD"):
+        service.build(SupportResistanceRequest(symbol="DOGE_USD"))
+
+
+def test_fallback_base_price_is_cached_per_symbol(settings: AgentSettings) -> None:
+    service = SupportResistanceService(settings=settings, history=MagicMock())
+    service._price_fetcher = MagicMock()
+    service._price_fetcher.fetch_price.return_value = MagicMock(price=2000.0)
+
+    assert service._fallback_base_price("ETH_USD") == 2000.0
+    assert service._fallback_base_price("ETH_USD") == 2000.0
+
+    assert service._price_fetcher.fetch_price.call_count == 1
+
+
+def test_support_resistance_build_skips_clustering_for_narrow_range(
+    settings: AgentSettings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    window = 4 * 60 * 60
+    updates = [PriceUpdate(publish_time=i * window, price=100_000 + (i % 7), expo=-2) for i in range(30)]
+    service = SupportResistanceService(settings=settings, history=MagicMock())
+    service._history.iter_updates.return_value = [updates]
+    service._window = lambda: (0, 30 * window)
+    fallback = MagicMock(wraps=service._fallback_bands)
+    monkeypatch.setattr(service, "_fallback_bands", fallback)
+    monkeypatch.setattr(
+        "backend.agent.services.support_resistance.rank_bands",
+        MagicMock(side_effect=AssertionError("clustering should be skipped")),
+    )
+
+    service.build(SupportResistanceRequest(symbol="ETH_USD", tolerance_pct=0.01))
+
+    assert fallback.call_args.kwargs["extrema"] == (1000.0, 1000.06)
+
+
+def _random_walk_candles(seed: int, n: int = 30) -> List[Candle]:
+    window = 4 * 60 * 60
+    rng = np.random.default_rng(seed)
+    closes = (2000.0 * np.exp(np.cumsum(rng.normal(0.0, 0.005, size=n)))).tolist()
+    return [Candle(i * window, (i + 1) * window, c, c, c, c, 1) for i, c in enumerate(closes)]
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("tolerance_pct", [0.002, 0.005, 0.01])
+def test_fallback_bands_match_zero_threshold_relaxed_pass(
+    settings: AgentSettings, monkeypatch: pytest.MonkeyPatch, seed: int, tolerance_pct: float
+) -> None:
+    candles = _random_walk_candles(seed)
+    service = SupportResistanceService(settings=settings, history=MagicMock())
+    fallback = MagicMock(wraps=service._fallback_bands)
+    monkeypatch.setattr(service, "_fallback_bands", fallback)
+    request = SupportResistanceRequest(symbol="ETH_USD", tolerance_pct=tolerance_pct, projection_hours=24)
+
+    response = service._analyze_candles(request, candles, "ETH", "0xff", "now")
+
+    if not fallback.called:
+        return
+    # The relaxed pass rescans with a zero move threshold, not the filtered first-pass pivots
+    relaxed = build_bands(
+        detect_reversals(candles, min_separation_bars=1, min_price_move_pct=0.0),
+        tolerance_pct=max(tolerance_pct * 2, 0.005),
+        min_touches=2,
+    )
+    if relaxed:
+        expected = [(b.band_type, b.mid, b.touch_count) for b in project_bands(relaxed, projection_hours=24)]
+    else:
+        expected = [("support", min(c.close for c in candles), 3), ("resistance", max(c.close for c in candles), 3)]
+    assert [(b.type, b.mid, b.touchCount) for b in response.bands] == expected
+
+
+def test_services_share_fetchers_per_settings(settings: AgentSettings) -> None:
+    first = SupportResistanceService(settings=settings)
+    second = SupportResistanceService(settings=settings)
+
+    assert first._history is second._history
+    assert first._price_fetcher is second._price_fetcher
+
+
+def test_injected_history_skips_shared_history_fetcher(settings: AgentSettings) -> None:
+    injected = MagicMock()
+
+    service = SupportResistanceService(settings=settings, history=injected)
+
+    assert service._history is injected
+    assert support_resistance._shared_fetchers[id(settings)].history is None
+
+
+def test_support_resistance_abuild_uses_synthetic_when_history_times_out(settings: AgentSettings) -> None:
+    service = SupportResistanceService(settings=settings, history=MagicMock())
+    service._history.iter_updates.side_effect = lambda *args, **kwargs: iter([time.sleep(0.5) or []])
+    service._history_timeout = 0.05
+    service._price_fetcher = MagicMock()
+    service._price_fetcher.fetch_price.return_value = MagicMock(price=2000.0)
+
+    response = asyncio.run(service.abuild(SupportResistanceRequest(symbol="ETH_USD")))
+
+    assert response.bands
+    assert response.source == "synthetic"
+
+
+def test_support_resistance_abuild_skips_price_lookup_when_history_succeeds(settings: AgentSettings) -> None:
+    window = 4 * 60 * 60
+    updates = [PriceUpdate(publish_time=i * window + 120, price=200_000 + 500 * (i % 9), expo=-2) for i in range(30)]
+    service = SupportResistanceService(settings=settings, history=MagicMock())
+    service._history.iter_updates.return_value = [updates]
+    service._window = lambda: (0, 30 * window)
+    service._price_fetcher = MagicMock()
+
+    response = asyncio.run(service.abuild(SupportResistanceRequest(symbol="ETH_USD")))
+
+    assert response.source == "pyth"
+    service._price_fetcher.fetch_price.assert_not_called()
+
+
+def test_history_candles_refetch_when_stream_breaks_off(settings: AgentSettings) -> None:
+    window = 4 * 60 * 60
+    updates = [PriceUpdate(publish_time=i * window, price=200_000 + 500 * (i % 9), expo=-2) for i in range(30)]
+
+    def broken_pages(*args: object, **kwargs: object):
+        yield updates[:3]
+        raise IncompleteHistoryError("page 2 failed")
+
+    service = SupportResistanceService(settings=settings, history=MagicMock())
+    service._history.iter_updates.side_effect = broken_pages
+    service._history.fetch_updates.return_value = updates
+
+    candles = service._history_candles("0xff", 0, 30 * window)
+
+    service._history.fetch_updates.assert_called_once_with("0xff", 0, 30 * window)
+    assert [c.close for c in candles] == [u.price / 100 for u in updates]
+
+
+def test_support_resistance_does_not_cache_synthetic_results(settings: AgentSettings) -> None:
+    service = SupportResistanceService(settings=settings, history=MagicMock())
+    service._history.iter_updates.return_value = []
+    service._price_fetcher = MagicMock()
+    service._price_fetcher.fetch_price.return_value = MagicMock(price=2000.0)
+    request = SupportResistanceRequest(symbol="ETH_USD")
+
+    service.build(request)
+    service.build(request)
+
+    assert service._history.iter_updates.call_count == 2
+
+
+def test_support_resistance_abuild_stops_history_worker_after_timeout(settings: AgentSettings) -> None:
+    consumed: List[int] = []
+
+    def slow_pages(*args: object, **kwargs: object):
+        for page in range(20):
+            time.sleep(0.05)
+            consumed.append(page)
+            yield []
+
+    service = SupportResistanceService(settings=settings, history=MagicMock())
+    service._history.iter_updates.side_effect = slow_pages
+    service._history_timeout = 0.08
+    service._price_fetcher = MagicMock()
+    service._price_fetcher.fetch_price.return_value = MagicMock(price=2000.0)
+
+    asyncio.run(service.abuild(SupportResistanceRequest(symbol="ETH_USD")))
+    time.sleep(0.2)
+
+    assert len(consumed) < 6
+
+
+def test_support_resistance_constructed_response_round_trips_validation(settings: AgentSettings) -> None:
+    service = SupportResistanceService(settings=settings, history=MagicMock())
+    service._history.iter_updates.return_value = []
+    service._price_fetcher = MagicMock()
+    service._price_fetcher.fetch_price.return_value = MagicMock(price=2000.0)
+
+    response = service.build(SupportResistanceRequest(symbol="ETH_USD"))
+    validated = SupportResistanceResponse.model_validate(response.model_dump())
+
+    assert validated == response
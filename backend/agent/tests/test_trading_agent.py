@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
+import pytest
+
 from backend.agent.core.agent import TradingAgent
 from backend.agent.core.strategies.strategy_base import Strategy, TradeSignal
 from backend.agent.core.tools.contract_executor import ExecutionResult
@@ -51,55 +55,57 @@ class DummyStrategy(Strategy):
 
     def __init__(self, should_enter: bool) -> None:
         self._should_enter = should_enter
-
-    def collect_market_data(self, price_fetcher: DummyPriceFetcher) -> PriceData:
-        return price_fetcher.fetch_price("ETH_USD")
-
-    def generate_signal(self, market_state: PriceData) -> TradeSignal:
-        return TradeSignal(
-            should_enter=self._should_enter,
+        self._signal_template = TradeSignal(
+            should_enter=should_enter,
             from_token="0xfrom",
             to_token="0xto",
             amount=1_000,
-            expected_price=market_state.price,
+            expected_price=100.0,
             portfolio_value=10_000,
             position_size=2_000,
         )
 
+    def collect_market_data(self, price_fetcher: DummyPriceFetcher) -> PriceData:
+        return price_fetcher.fetch_price("ETH_USD")
+
+    def generate_signal(self, market_state: PriceData) -> TradeSignal:
+        if market_state.price == self._signal_template.expected_price:
+            return self._signal_template
+        return replace(self._signal_template, expected_price=market_state.price)
+
     def build_execution_params(self, signal: TradeSignal, quote: QuoteResult) -> dict:
         return {"amount": signal.amount, "tx": quote.tx_data}
 
 
-def test_agent_executes_when_signal_and_risk_pass() -> None:
-    strategy = DummyStrategy(should_enter=True)
-    executor = DummyExecutor()
-    agent = TradingAgent(
-        strategy=strategy,
-        price_fetcher=DummyPriceFetcher(),
-        quote_fetcher=DummyQuoteFetcher(),
-        executor=executor,
-        risk_manager=DummyRiskManager(allow=True),
-    )
+@pytest.fixture(scope="module")
+def price_fetcher() -> DummyPriceFetcher:
+    return DummyPriceFetcher()
 
-    agent.run_cycle()
 
-    assert executor.called is True
-    assert executor.last_args[0] == strategy.strategy_id
+@pytest.fixture(scope="module")
+def quote_fetcher() -> DummyQuoteFetcher:
+    return DummyQuoteFetcher()
 
 
-def test_agent_skips_when_risk_fails() -> None:
+@pytest.mark.parametrize("allow,expected_called", [(True, True), (False, False)])
+def test_agent_run_cycle(
+    allow: bool,
+    expected_called: bool,
+    price_fetcher: DummyPriceFetcher,
+    quote_fetcher: DummyQuoteFetcher,
+) -> None:
     strategy = DummyStrategy(should_enter=True)
     executor = DummyExecutor()
     agent = TradingAgent(
         strategy=strategy,
-        price_fetcher=DummyPriceFetcher(),
-        quote_fetcher=DummyQuoteFetcher(),
+        price_fetcher=price_fetcher,
+        quote_fetcher=quote_fetcher,
         executor=executor,
-        risk_manager=DummyRiskManager(allow=False),
+        risk_manager=DummyRiskManager(allow=allow),
     )
 
     agent.run_cycle()
 
-    assert executor.called is False
-
-
+    assert executor.called is expected_called
+    if expected_called:
+        assert executor.last_args[0] == strategy.strategy_id
@@ -1,3 +1,5 @@
+import numpy as np
+
 from backend.agent.core.analytics.ohlc import Candle
 from backend.agent.core.analytics.validation import validate_candles
 
@@ -24,3 +26,37 @@ def test_validate_candles_insufficient_unique_prices() -> None:
     assert not ok
     assert "insufficient_unique_prices" in reasons
 
+
+def test_validate_candles_counts_unique_closes_and_real_candles() -> None:
+    closes = [101.0, 100.0, 102.0, 100.0, 103.0, 101.0]
+    candles = [Candle(i, i + 1, c, c, c, c, 1, synthetic=False) for i, c in enumerate(closes)]
+    synthetic_only = [Candle(i, i + 1, 100.0, 100.0, 100.0, 100.0, 0, synthetic=True) for i in range(6)]
+
+    assert validate_candles(candles, expected_count=6, minimum_unique=4) == (True, [])
+    assert validate_candles(candles, expected_count=6, minimum_unique=5) == (False, ["insufficient_unique_prices"])
+    assert validate_candles(synthetic_only, expected_count=6, minimum_unique=1) == (False, ["no_real_candles"])
+
+
+def test_validate_candles_accepts_column_arrays() -> None:
+    n = 30
+    times = np.arange(n)
+    closes = np.full(n, 105.0)
+    closes[:6] = [101.0, 100.0, 102.0, 100.0, 103.0, 101.0]
+    synthetic = np.ones(n, dtype=bool)
+    synthetic[:6] = False
+    columns = Candle.from_arrays(times, times + 1, closes, closes, closes, closes, np.ones(n), synthetic)
+    candles = [
+        Candle(int(t), int(t) + 1, float(c), float(c), float(c), float(c), 1, synthetic=bool(s))
+        for t, c, s in zip(times, closes, synthetic)
+    ]
+
+    assert len(columns) == n
+    assert validate_candles(columns, expected_count=30, minimum_unique=5) == (True, [])
+    assert validate_candles(columns, expected_count=30, minimum_unique=6) == validate_candles(
+        candles, expected_count=30, minimum_unique=6
+    )
+    no_real = Candle.from_arrays(times, times + 1, closes, closes, closes, closes, np.zeros(n), np.ones(n, dtype=bool))
+    assert validate_candles(no_real, expected_count=31, minimum_unique=1) == (
+        False,
+        ["insufficient_candles", "no_real_candles"],
+    )
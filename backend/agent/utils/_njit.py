@@ -0,0 +1,59 @@
+"""Optional Numba JIT decorator with a pure-Python fallback.
+
+Numba is an optional accelerator for the analytics kernels. When it is not
+installed the decorated functions run as ordinary Python so behaviour and
+tests are identical either way.
+
+Numba itself is imported lazily, on the first call of a decorated kernel,
+so importing the analytics modules (and collecting tests) does not pay its
+import cost. Kernels should pass ``cache=True`` so compiled code is reused
+from ``__pycache__`` across processes. Because the returned wrapper is a
+plain Python function, decorated kernels must not call one another.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+from typing import Any, Callable, Optional
+
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+@functools.cache
+def _numba_njit() -> Optional[Callable[..., Any]]:
+    try:
+        from numba import njit as numba_njit
+    except ImportError:  # pragma: no cover - depends on the environment
+        return None
+    return numba_njit
+
+
+def _lazy_jit(func: Callable[..., Any], options: dict[str, Any]) -> Callable[..., Any]:
+    impl: Optional[Callable[..., Any]] = None
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        nonlocal impl
+        if impl is None:
+            numba_njit = _numba_njit()
+            impl = numba_njit(**options)(func) if numba_njit is not None else func
+        return impl(*args, **kwargs)
+
+    return wrapper
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Drop-in replacement for ``numba.njit`` supporting both decorator forms."""
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return _lazy_jit(args[0], {})
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return _lazy_jit(func, kwargs)
+
+    return decorator
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit"]
@@ -0,0 +1,29 @@
+"""Root pytest configuration shared by the top-level smoke scripts.
+
+Living at the repository root also puts the root on sys.path (rootdir conftest),
+so the scripts can import ``backend`` without path shims.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="run tests that call live third-party APIs (Pyth Hermes, 1inch)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "network: test talks to live third-party APIs; needs --run-network")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
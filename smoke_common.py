@@ -0,0 +1,28 @@
+"""Cached loaders shared by the top-level smoke test scripts.
+
+Contract artifacts and agent settings are parsed once per process and shared
+by every script that imports them.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from backend.agent.config.settings import AgentSettings
+
+
+@lru_cache(maxsize=None)
+def load_addresses() -> dict:
+    """Parse contracts/addresses.json once and share it across tests."""
+    return json.loads(Path("contracts/addresses.json").read_text())
+
+
+@lru_cache(maxsize=None)
+def load_abi(name: str) -> dict:
+    """Parse an ABI artifact from contracts/abi once per file."""
+    return json.loads((Path("contracts/abi") / name).read_text())
+
+
+@lru_cache(maxsize=None)
+def agent_settings() -> AgentSettings:
+    return AgentSettings()
@@ -0,0 +1,30 @@
+"""Buffered output helper for the top-level smoke test scripts."""
+
+import sys
+from typing import List
+
+
+class Reporter:
+    """Collect diagnostic lines and write them to stdout in a single call on exit."""
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+
+    def __enter__(self) -> "Reporter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> bool:
+        if self._lines:
+            # Resolve sys.stdout at exit so pytest's capture stream is honoured
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+        return False
+
+    def info(self, message: str) -> None:
+        self._lines.append(message)
+
+    def ok(self, message: str) -> None:
+        self._lines.append(f"✅ {message}")
+
+    def fail(self, message: str) -> None:
+        self._lines.append(f"❌ {message}")
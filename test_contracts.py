@@ -4,124 +4,131 @@ Test contract interaction with deployed Sepolia contracts.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-# Add the project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-
 from backend.agent.core.tools.contract_executor import ContractExecutor
-from backend.agent.config.settings import AgentSettings
-import json
+from smoke_common import agent_settings, load_abi, load_addresses
+from smoke_reporter import Reporter
+
+
+@lru_cache(maxsize=None)
+def _executor() -> ContractExecutor:
+    """Build the executor (and its Web3 provider) once for all tests."""
+    return ContractExecutor(agent_settings())
+
+
+@lru_cache(maxsize=None)
+def _contract(address_key: str, abi_file: str):
+    """Build a Web3 contract for a deployed Sepolia address once per process."""
+    address = load_addresses()["11155111"][address_key]
+    # load_abi raises FileNotFoundError naming the artifact path when it is missing
+    return _executor().web3.eth.contract(address=address, abi=load_abi(abi_file)["abi"])
+
+
+def _chain_status(web3) -> tuple:
+    """Return (chain_id, block_number), batched into one JSON-RPC request when supported."""
+    if hasattr(web3, "batch_requests"):
+        try:
+            with web3.batch_requests() as batch:
+                batch.add(web3.eth.chain_id)
+                batch.add(web3.eth.block_number)
+                chain_id, block_number = batch.execute()
+            return chain_id, block_number
+        except Exception:
+            # Some RPC endpoints reject JSON-RPC batches; fall back to two calls
+            pass
+    return web3.eth.chain_id, web3.eth.block_number
 
 
 def test_contract_loading():
     """Test loading contract ABIs and addresses."""
-    print("🔗 Testing Contract Loading...")
-    
-    try:
-        settings = AgentSettings()
-        executor = ContractExecutor(settings)
-        
-        # Load addresses
-        with open("contracts/addresses.json", "r") as f:
-            addresses = json.load(f)
-        
-        sepolia_addresses = addresses.get("11155111", {})
-        print(f"✅ Loaded Sepolia addresses: {list(sepolia_addresses.keys())}")
-        
-        # Test loading ABI files
-        abi_dir = Path("contracts/abi")
-        abi_files = list(abi_dir.glob("*.json"))
-        print(f"✅ Found ABI files: {[f.name for f in abi_files]}")
+    with Reporter() as r:
+        r.info("🔗 Testing Contract Loading...")
         
-        # Test Web3 connection
-        if executor.web3.is_connected():
-            print("✅ Web3 connection successful")
-            print(f"   Chain ID: {executor.web3.eth.chain_id}")
-            print(f"   Latest block: {executor.web3.eth.block_number}")
-        else:
-            print("❌ Web3 connection failed")
-            return False
+        try:
+            executor = _executor()
             
-        return True
-        
-    except Exception as e:
-        print(f"❌ Contract loading failed: {e}")
-        return False
+            # Load addresses
+            addresses = load_addresses()
+            
+            sepolia_addresses = addresses.get("11155111", {})
+            r.ok(f"Loaded Sepolia addresses: {list(sepolia_addresses.keys())}")
+            
+            # Test loading ABI files
+            abi_dir = Path("contracts/abi")
+            abi_files = list(abi_dir.glob("*.json"))
+            r.ok(f"Found ABI files: {[f.name for f in abi_files]}")
+            
+            # Test Web3 connection
+            if executor.web3.is_connected():
+                chain_id, block_number = _chain_status(executor.web3)
+                r.ok("Web3 connection successful")
+                r.info(f"   Chain ID: {chain_id}")
+                r.info(f"   Latest block: {block_number}")
+            else:
+                r.fail("Web3 connection failed")
+                return False
+                
+            return True
+            
+        except Exception as e:
+            r.fail(f"Contract loading failed: {e}")
+            return False
 
 
 def test_agent_registry():
     """Test AgentRegistry contract interaction."""
-    print("\n📋 Testing AgentRegistry Contract...")
-    
-    try:
-        settings = AgentSettings()
-        executor = ContractExecutor(settings)
+    with Reporter() as r:
+        r.info("\n📋 Testing AgentRegistry Contract...")
         
-        # Load AgentRegistry ABI
-        with open("contracts/abi/AgentRegistry.json", "r") as f:
-            abi = json.load(f)
-        
-        # Get contract address
-        with open("contracts/addresses.json", "r") as f:
-            addresses = json.load(f)
-        
-        contract_address = addresses["11155111"]["agent_registry"]
-        print(f"   Contract address: {contract_address}")
-        
-        # Create contract instance
-        contract = executor.web3.eth.contract(
-            address=contract_address,
-            abi=abi["abi"]  # Extract just the ABI from the Hardhat output
-        )
-        
-        # Test reading from contract (view functions)
         try:
-            # Try to call a view function if available
-            print("✅ AgentRegistry contract loaded successfully")
-            print(f"   Contract code: {contract.functions}")
+            contract = _contract("agent_registry", "AgentRegistry.json")
+            r.info(f"   Contract address: {contract.address}")
+            
+            # Test reading from contract (view functions)
+            try:
+                # Try to call a view function if available
+                r.ok("AgentRegistry contract loaded successfully")
+                r.info(f"   Contract code: {contract.functions}")
+            except Exception as e:
+                r.info(f"⚠️  Could not call contract functions: {e}")
+                r.info("   (This is normal if the contract doesn't have view functions)")
+            
+            return True
+            
         except Exception as e:
-            print(f"⚠️  Could not call contract functions: {e}")
-            print("   (This is normal if the contract doesn't have view functions)")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ AgentRegistry test failed: {e}")
-        return False
+            r.fail(f"AgentRegistry test failed: {e}")
+            return False
 
 
 def test_strategy_contracts():
     """Test strategy contract interaction."""
-    print("\n🎯 Testing Strategy Contracts...")
-    
-    try:
-        settings = AgentSettings()
-        executor = ContractExecutor(settings)
-        
-        # Load addresses
-        with open("contracts/addresses.json", "r") as f:
-            addresses = json.load(f)
+    with Reporter() as r:
+        r.info("\n🎯 Testing Strategy Contracts...")
         
-        sepolia_addresses = addresses["11155111"]
-        strategy_contracts = [
-            ("ArbitrageAgent", sepolia_addresses.get("arbitrage_agent")),
-            ("DCAAgent", sepolia_addresses.get("dca_agent")),
-            ("GridTradingAgent", sepolia_addresses.get("grid_trading_agent")),
-        ]
-        
-        for name, address in strategy_contracts:
-            if address:
-                print(f"   ✅ {name}: {address}")
-            else:
-                print(f"   ⚠️  {name}: No address found")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Strategy contracts test failed: {e}")
-        return False
+        try:
+            # Load addresses
+            addresses = load_addresses()
+            
+            sepolia_addresses = addresses["11155111"]
+            strategy_contracts = [
+                ("ArbitrageAgent", sepolia_addresses.get("arbitrage_agent")),
+                ("DCAAgent", sepolia_addresses.get("dca_agent")),
+                ("GridTradingAgent", sepolia_addresses.get("grid_trading_agent")),
+            ]
+            
+            for name, address in strategy_contracts:
+                if address:
+                    r.info(f"   ✅ {name}: {address}")
+                else:
+                    r.info(f"   ⚠️  {name}: No address found")
+            
+            return True
+            
+        except Exception as e:
+            r.fail(f"Strategy contracts test failed: {e}")
+            return False
 
 
 def main():
@@ -6,130 +6,146 @@ Simple test without Web3 connection.
 import sys
 from pathlib import Path
 
-# Add the project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+import httpx
+import numpy as np
+import pytest
 
 from backend.agent.core.tools.price_fetcher import PriceFetcher
 from backend.agent.core.tools.rsi_calculator import RSICalculator
 from backend.agent.core.tools.quote_fetcher import QuoteFetcher
-from backend.agent.config.settings import AgentSettings
-import json
+from smoke_common import agent_settings, load_abi, load_addresses
+from smoke_reporter import Reporter
 
+# One pooled client shared by every HTTP-backed tool so connections (and TLS
+# sessions) are reused across tests; connect failures are retried.
+HTTP_CLIENT = httpx.Client(
+    timeout=10.0,
+    transport=httpx.HTTPTransport(
+        retries=3,
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+    ),
+)
 
+
+@pytest.mark.network
 def test_price_fetcher():
     """Test price fetching."""
-    print("🔍 Testing Price Fetcher...")
-    try:
-        settings = AgentSettings()
-        fetcher = PriceFetcher(settings)
-        price = fetcher.fetch_price('ETH_USD')
-        print(f"✅ ETH Price: ${price.price:.2f} (confidence: {price.confidence:.2f})")
-        return True
-    except Exception as e:
-        print(f"❌ Price fetch failed: {e}")
-        return False
-
-
+    with Reporter() as r:
+        r.info("🔍 Testing Price Fetcher...")
+        try:
+            settings = agent_settings()
+            fetcher = PriceFetcher(settings, client=HTTP_CLIENT)
+            # Every configured feed in one latest_price_feeds request
+            prices = fetcher.fetch_prices(list(settings.pyth.price_feed_ids))
+            for symbol, price in prices.items():
+                r.ok(f"{symbol.split('_')[0]} Price: ${price.price:.2f} (confidence: {price.confidence:.2f})")
+            return True
+        except Exception as e:
+            r.fail(f"Price fetch failed: {e}")
+            return False
+
+
+@pytest.mark.network
 def test_rsi_calculator():
     """Test RSI calculation."""
-    print("\n📊 Testing RSI Calculator...")
-    try:
-        settings = AgentSettings()
-        fetcher = PriceFetcher(settings)
-        rsi_calc = RSICalculator(period=14)
-        
-        # Get 15 prices for RSI calculation
-        prices = []
-        for i in range(15):
-            price = fetcher.fetch_price('ETH_USD')
-            prices.append(price.price)
-            print(f"  Price {i+1}: ${price.price:.2f}")
-        
-        rsi = RSICalculator.from_series(prices, period=14)
-        print(f"✅ RSI: {rsi:.2f}")
-        
-        # Determine signal
-        if rsi < 30:
-            signal = "🟢 BUY (Oversold)"
-        elif rsi > 70:
-            signal = "🔴 SELL (Overbought)"
-        else:
-            signal = "⚪ HOLD (Neutral)"
-        
-        print(f"📈 Signal: {signal}")
-        return True
-    except Exception as e:
-        print(f"❌ RSI calculation failed: {e}")
-        return False
+    with Reporter() as r:
+        r.info("\n📊 Testing RSI Calculator...")
+        try:
+            settings = agent_settings()
+            fetcher = PriceFetcher(settings, client=HTTP_CLIENT)
+            rsi_calc = RSICalculator(period=14)
+            
+            # Get 15 prices for RSI calculation in a single history request
+            prices = fetcher.fetch_recent_prices('ETH_USD', 15)
+            for i, price in enumerate(prices):
+                r.info(f"  Price {i+1}: ${price:.2f}")
+            
+            rsi = RSICalculator.from_ndarray(np.asarray(prices), period=14)
+            r.ok(f"RSI: {rsi:.2f}")
+            
+            # Determine signal
+            if rsi < 30:
+                signal = "🟢 BUY (Oversold)"
+            elif rsi > 70:
+                signal = "🔴 SELL (Overbought)"
+            else:
+                signal = "⚪ HOLD (Neutral)"
+            
+            r.info(f"📈 Signal: {signal}")
+            return True
+        except Exception as e:
+            r.fail(f"RSI calculation failed: {e}")
+            return False
 
 
+@pytest.mark.network
 def test_quote_fetcher():
     """Test quote fetching."""
-    print("\n💱 Testing Quote Fetcher...")
-    try:
-        settings = AgentSettings()
-        quote_fetcher = QuoteFetcher(settings)
-        
-        # Use Sepolia WETH and USDC addresses
-        from_token = "0xfFf9976782d46CC05630D1f6eBAb18b2324d6B14"  # WETH on Sepolia
-        to_token = "0x94a9D9AC8a22534E3FaCa9F4e7F2E2cf85d5E4C8"    # USDC on Sepolia
-        amount = 1000000000000000000  # 1 ETH in wei
-        
-        quote = quote_fetcher.fetch_swap_quote(from_token, to_token, amount)
-        print(f"✅ Quote: {quote}")
-        return True
-    except Exception as e:
-        print(f"❌ Quote fetch failed: {e}")
-        return False
+    with Reporter() as r:
+        r.info("\n💱 Testing Quote Fetcher...")
+        try:
+            settings = agent_settings()
+            quote_fetcher = QuoteFetcher(settings, client=HTTP_CLIENT)
+            
+            # Use Sepolia WETH and USDC addresses
+            from_token = "0xfFf9976782d46CC05630D1f6eBAb18b2324d6B14"  # WETH on Sepolia
+            to_token = "0x94a9D9AC8a22534E3FaCa9F4e7F2E2cf85d5E4C8"    # USDC on Sepolia
+            amount = 1000000000000000000  # 1 ETH in wei
+            
+            quote = quote_fetcher.fetch_swap_quote(from_token, to_token, amount)
+            r.ok(f"Quote: {quote}")
+            return True
+        except Exception as e:
+            r.fail(f"Quote fetch failed: {e}")
+            return False
 
 
 def test_contract_addresses():
     """Test contract address loading."""
-    print("\n🔗 Testing Contract Addresses...")
-    try:
-        with open("contracts/addresses.json", "r") as f:
-            addresses = json.load(f)
-        
-        sepolia_addresses = addresses.get("11155111", {})
-        print(f"✅ Loaded Sepolia addresses: {list(sepolia_addresses.keys())}")
-        
-        # Check specific contracts
-        contracts = ["agent_registry", "arbitrage_agent", "dca_agent", "grid_trading_agent"]
-        for contract in contracts:
-            address = sepolia_addresses.get(contract)
-            if address:
-                print(f"   ✅ {contract}: {address}")
-            else:
-                print(f"   ❌ {contract}: Not found")
-        
-        return True
-    except Exception as e:
-        print(f"❌ Contract addresses test failed: {e}")
-        return False
+    with Reporter() as r:
+        r.info("\n🔗 Testing Contract Addresses...")
+        try:
+            addresses = load_addresses()
+            
+            sepolia_addresses = addresses.get("11155111", {})
+            r.ok(f"Loaded Sepolia addresses: {list(sepolia_addresses.keys())}")
+            
+            # Check specific contracts
+            contracts = ["agent_registry", "arbitrage_agent", "dca_agent", "grid_trading_agent"]
+            for contract in contracts:
+                address = sepolia_addresses.get(contract)
+                if address:
+                    r.info(f"   ✅ {contract}: {address}")
+                else:
+                    r.info(f"   ❌ {contract}: Not found")
+            
+            return True
+        except Exception as e:
+            r.fail(f"Contract addresses test failed: {e}")
+            return False
 
 
 def test_abi_files():
     """Test ABI file loading."""
-    print("\n📄 Testing ABI Files...")
-    try:
-        abi_dir = Path("contracts/abi")
-        abi_files = list(abi_dir.glob("*.json"))
-        print(f"✅ Found ABI files: {[f.name for f in abi_files]}")
-        
-        # Test loading each ABI
-        for abi_file in abi_files:
-            try:
-                with open(abi_file, "r") as f:
-                    abi_data = json.load(f)
-                print(f"   ✅ {abi_file.name}: {len(abi_data.get('abi', []))} functions")
-            except Exception as e:
-                print(f"   ❌ {abi_file.name}: {e}")
-        
-        return True
-    except Exception as e:
-        print(f"❌ ABI files test failed: {e}")
-        return False
+    with Reporter() as r:
+        r.info("\n📄 Testing ABI Files...")
+        try:
+            abi_dir = Path("contracts/abi")
+            abi_files = list(abi_dir.glob("*.json"))
+            r.ok(f"Found ABI files: {[f.name for f in abi_files]}")
+            
+            # Test loading each ABI
+            for abi_file in abi_files:
+                try:
+                    abi_data = load_abi(abi_file.name)
+                    r.info(f"   ✅ {abi_file.name}: {len(abi_data.get('abi', []))} functions")
+                except Exception as e:
+                    r.info(f"   ❌ {abi_file.name}: {e}")
+            
+            return True
+        except Exception as e:
+            r.fail(f"ABI files test failed: {e}")
+            return False
 
 
 def main():